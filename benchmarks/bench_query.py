@@ -0,0 +1,40 @@
+"""Query.from_string against the former `parse_qs` based parsing.
+
+    python benchmarks/bench_query.py
+"""
+import timeit
+from urllib.parse import parse_qs
+from kettu.headers import Query
+
+
+QUERIES = {
+    "simple": "page=2&sort=name&order=asc",
+    "encoded": "q=caf%C3%A9+au+lait&tags=a%2Cb&lang=fr",
+    "repeated": "&".join(f"id={i}" for i in range(1000)),
+}
+
+
+def parse_qs_query(value: str) -> Query:
+    return Query(
+        (key, tuple(val))
+        for key, val in parse_qs(
+            value, keep_blank_values=True, strict_parsing=True).items()
+    )
+
+
+def main(number: int = 2000):
+    for name, value in QUERIES.items():
+        loops = number // 100 if name == "repeated" else number
+        before = timeit.timeit(
+            lambda: parse_qs_query(value), number=loops)
+        after = timeit.timeit(
+            lambda: Query.from_string(value), number=loops)
+        print(
+            f"{name:>10}: parse_qs {before / loops * 1e6:8.2f}µs, "
+            f"from_string {after / loops * 1e6:8.2f}µs "
+            f"(x{before / after:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
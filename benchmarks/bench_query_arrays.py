@@ -0,0 +1,34 @@
+"""Query bulk accessors against a cast per value in Python.
+
+    python benchmarks/bench_query_arrays.py
+"""
+import timeit
+from kettu.headers import Query
+
+
+QUERY = Query.from_string("&".join(f"id={i}" for i in range(1000)))
+
+
+def main(number: int = 2000):
+    baseline = timeit.timeit(
+        lambda: [int(x) for x in QUERY.getlist('id')], number=number)
+    print(f"{'list':>10}: {baseline / number * 1e6:8.2f}µs")
+
+    accessors = {"as_ints": lambda: QUERY.as_ints('id')}
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print("NumPy is not installed : skipping as_ndarray.")
+    else:
+        accessors["as_ndarray"] = lambda: QUERY.as_ndarray('id')
+
+    for name, accessor in accessors.items():
+        elapsed = timeit.timeit(accessor, number=number)
+        print(
+            f"{name:>10}: {elapsed / number * 1e6:8.2f}µs "
+            f"(x{baseline / elapsed:.1f})"
+        )
+
+
+if __name__ == "__main__":
+    main()
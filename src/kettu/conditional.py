@@ -0,0 +1,138 @@
+import calendar
+from enum import Enum
+from datetime import datetime
+from typing import NamedTuple
+from collections.abc import Mapping
+from kettu.exceptions import HTTPError
+from kettu.headers import ETag, ETags
+from kettu.headers.utils import parse_http_timestamp
+
+
+class Precondition(int, Enum):
+    FULL = 200
+    RANGE = 206
+    NOT_MODIFIED = 304
+    FAILED = 412
+
+
+def header_value(headers: Mapping[str, str], name: str) -> str | None:
+    value = headers.get(name)
+    if value is None:
+        value = headers.get(name.lower())
+    return value
+
+
+def http_timestamp(value: str | None) -> int | None:
+    """Invalid dates are ignored, as RFC 9110 requires."""
+    if not value:
+        return None
+    try:
+        return parse_http_timestamp(value)
+    except ValueError:
+        return None
+
+
+def entity_tags(value: str | None, name: str) -> ETags | None:
+    """Malformed lists are rejected : ignoring them would skip a check."""
+    if not value:
+        return None
+    try:
+        return ETags.from_string(value)
+    except ValueError:
+        raise HTTPError(400, body=f"Malformed {name} header.")
+
+
+def epoch(value: datetime | int | float) -> int:
+    if isinstance(value, datetime):
+        return calendar.timegm(value.utctimetuple())
+    return int(value)
+
+
+class Conditions(NamedTuple):
+    """Preconditions of a request, evaluated in RFC 9110 § 13.2.2 order.
+    """
+    if_match: ETags | None = None
+    if_none_match: ETags | None = None
+    if_modified_since: int | None = None
+    if_unmodified_since: int | None = None
+    if_range: ETag | int | None = None
+    has_range: bool = False
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, str]) -> 'Conditions':
+        """Header names are expected canonical or lowercased."""
+        if_range = header_value(headers, 'If-Range')
+        if not if_range:
+            if_range = None
+        elif if_range.startswith(('"', 'W/', 'w/')):
+            if_range = ETag.from_string(if_range)
+        else:
+            if_range = http_timestamp(if_range)
+        return cls(
+            if_match=entity_tags(
+                header_value(headers, 'If-Match'), 'If-Match'),
+            if_none_match=entity_tags(
+                header_value(headers, 'If-None-Match'), 'If-None-Match'),
+            if_modified_since=http_timestamp(
+                header_value(headers, 'If-Modified-Since')),
+            if_unmodified_since=http_timestamp(
+                header_value(headers, 'If-Unmodified-Since')),
+            if_range=if_range,
+            has_range=bool(header_value(headers, 'Range'))
+        )
+
+    def evaluate(
+            self,
+            method: str = "GET",
+            etag: ETag | None = None,
+            last_modified: datetime | int | float | None = None
+    ) -> Precondition:
+        if last_modified is not None:
+            last_modified = epoch(last_modified)
+        safe = method in ("GET", "HEAD")
+
+        if self.if_match is not None:
+            # Strong comparison.
+            if not self.if_match.wildcard and (
+                    etag is None or etag.weak or
+                    ETag(etag.value) not in self.if_match):
+                return Precondition.FAILED
+        elif (self.if_unmodified_since is not None and
+              last_modified is not None and
+              last_modified > self.if_unmodified_since):
+            return Precondition.FAILED
+
+        if self.if_none_match is not None:
+            # Weak comparison.
+            if self.if_none_match.wildcard or (
+                    etag is not None and etag.value in self.if_none_match):
+                return (
+                    Precondition.NOT_MODIFIED if safe
+                    else Precondition.FAILED
+                )
+        elif (safe and self.if_modified_since is not None and
+              last_modified is not None and
+              last_modified <= self.if_modified_since):
+            return Precondition.NOT_MODIFIED
+
+        if not self.has_range or method != "GET":
+            return Precondition.FULL
+        if self.if_range is None:
+            return Precondition.RANGE
+        if isinstance(self.if_range, ETag):
+            if (etag is not None and not etag.weak and
+                    self.if_range.compare(etag)):
+                return Precondition.RANGE
+        elif last_modified is not None and last_modified == self.if_range:
+            return Precondition.RANGE
+        return Precondition.FULL
+
+
+def evaluate_preconditions(
+        headers: Mapping[str, str],
+        method: str = "GET",
+        etag: ETag | None = None,
+        last_modified: datetime | int | float | None = None
+) -> Precondition:
+    return Conditions.from_headers(headers).evaluate(
+        method, etag=etag, last_modified=last_modified)
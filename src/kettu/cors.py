@@ -1,63 +1,226 @@
-from dataclasses import dataclass
-from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from collections.abc import Iterable, Sequence
 from kettu.types import HTTPMethod
+from kettu.headers.cache import ParsingCache
 
 
 Header = tuple[str, str]
+Headers = tuple[Header, ...]
 
 
-@dataclass
+def normalize_header_names(value: str) -> str:
+    """Lowercased, deduplicated and sorted list of header names."""
+    return ", ".join(sorted({
+        name for name in value.lower().replace(" ", "").split(",") if name
+    }))
+
+
+class Origins:
+    """Allow-list of origins.
+
+    Entries such as `https://*.example.com` allow any subdomain of
+    `example.com` for that scheme. Lookups are set membership, done
+    for each label of the origin host at worst.
+    """
+    __slots__ = ("exact", "suffixes")
+
+    exact: frozenset[str]
+    suffixes: dict[str, frozenset[str]]
+
+    def __init__(self, origins: Iterable[str]):
+        exact = set()
+        suffixes = {}
+        for origin in origins:
+            scheme, _, host = origin.lower().partition("://")
+            if host.startswith("*."):
+                suffixes.setdefault(scheme, set()).add(host[1:])
+            else:
+                exact.add(origin.lower())
+        self.exact = frozenset(exact)
+        self.suffixes = {
+            scheme: frozenset(hosts) for scheme, hosts in suffixes.items()
+        }
+
+    def __contains__(self, origin: str) -> bool:
+        if origin in self.exact:
+            return True
+        if not self.suffixes:
+            return False
+        scheme, _, host = origin.lower().partition("://")
+        suffixes = self.suffixes.get(scheme)
+        if suffixes is None:
+            return False
+        pos = host.find(".")
+        while pos > 0:
+            if host[pos:] in suffixes:
+                return True
+            pos = host.find(".", pos + 1)
+        return False
+
+
+@dataclass(frozen=True)
 class CORSPolicy:
-    origin: str = "*"
+    """CORS headers, serialized once at construction.
+
+    `origin` is either `*`, a single origin or a sequence of allowed
+    origins, possibly with wildcard subdomains, in which case the
+    allowed request origin is echoed back.
+    With a `preflight_cache_size`, preflight responses are kept in a
+    bounded LRU cache, keyed on what the response actually depends on.
+    """
+    origin: str | Sequence[str] = "*"
     methods: Sequence[HTTPMethod] | None = None
     allow_headers: Sequence[str] | None = None
     expose_headers: Sequence[str] | None = None
     credentials: bool | None = None
     max_age: int | None = None
+    preflight_cache_size: int | None = None
+
+    _origins: Origins | None = field(
+        init=False, repr=False, compare=False)
+    _allow_methods: Headers = field(init=False, repr=False, compare=False)
+    _allow_headers: Headers = field(init=False, repr=False, compare=False)
+    _common: Headers = field(init=False, repr=False, compare=False)
+    _headers: Headers = field(init=False, repr=False, compare=False)
+    _denied: Headers = field(init=False, repr=False, compare=False)
+    _preflight_vary: Headers = field(init=False, repr=False, compare=False)
+    _preflight_cache: ParsingCache | None = field(
+        init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        freeze = object.__setattr__
+        if isinstance(self.origin, str) and "*." not in self.origin:
+            origins = None
+            allow_origin = (("Access-Control-Allow-Origin", self.origin),)
+        else:
+            origins = Origins(
+                (self.origin,) if isinstance(self.origin, str)
+                else self.origin
+            )
+            allow_origin = ()
+        freeze(self, "_origins", origins)
 
-    def headers(self) -> Iterator[Header]:
-        yield "Access-Control-Allow-Origin", self.origin
+        allow_methods = ()
         if self.methods is not None:
-            values = ", ".join(self.methods)
-            yield "Access-Control-Allow-Methods", values
+            allow_methods = ((
+                "Access-Control-Allow-Methods", ", ".join(self.methods)
+            ),)
+        freeze(self, "_allow_methods", allow_methods)
+
+        allow_headers = ()
         if self.allow_headers is not None:
-            values = ", ".join(self.allow_headers)
-            yield "Access-Control-Allow-Headers", values
+            allow_headers = ((
+                "Access-Control-Allow-Headers", ", ".join(self.allow_headers)
+            ),)
+        freeze(self, "_allow_headers", allow_headers)
+
+        common = ()
         if self.expose_headers is not None:
-            values = ", ".join(self.expose_headers)
-            yield "Access-Control-Expose-Headers", values
+            common += ((
+                "Access-Control-Expose-Headers",
+                ", ".join(self.expose_headers)
+            ),)
         if self.max_age is not None:
-            yield "Access-Control-Max-Age", str(self.max_age)
+            common += (("Access-Control-Max-Age", str(self.max_age)),)
         if self.credentials:
-            yield "Access-Control-Allow-Credentials", "true"
+            common += (("Access-Control-Allow-Credentials", "true"),)
+        freeze(self, "_common", common)
+
+        allowed = allow_methods + allow_headers + common
+        freeze(self, "_headers", allow_origin + allowed)
+        freeze(self, "_denied", (("Vary", "Origin"),) + allowed)
+
+        # A preflight response varies with everything it echoes back.
+        vary = []
+        if self.origin != "*":
+            vary.append("Origin")
+        if self.methods is None:
+            vary.append("Access-Control-Request-Method")
+        if self.allow_headers is None:
+            vary.append("Access-Control-Request-Headers")
+        freeze(
+            self, "_preflight_vary",
+            (("Vary", ", ".join(vary)),) if vary else ()
+        )
+
+        if self.preflight_cache_size is None:
+            freeze(self, "_preflight_cache", None)
+        else:
+            freeze(self, "_preflight_cache", ParsingCache(
+                self._cached_preflight, self.preflight_cache_size))
+
+    def allows(self, origin: str) -> bool:
+        if self._origins is None:
+            return self.origin == "*" or origin == self.origin
+        return origin in self._origins
+
+    def headers(self, origin: str | None = None) -> Headers:
+        if self._origins is None:
+            return self._headers
+        if origin and origin in self._origins:
+            return (
+                ("Access-Control-Allow-Origin", origin),
+                ("Vary", "Origin"),
+            ) + self._headers
+        return self._denied
 
     def preflight(
         self,
         origin: str | None = None,
         acr_method: str | None = None,
         acr_headers: str | None = None,
-    ) -> Iterator[Header]:
+    ) -> Headers:
+        if self._preflight_cache is None:
+            return self._preflight(origin, acr_method, acr_headers)
+
+        # Only keep what the response depends on, to share entries :
+        # denied origins all map to `None`, which yields the same headers.
+        if not origin:
+            origin = None
+        elif self._origins is None:
+            origin = self.origin
+        elif origin not in self._origins:
+            origin = None
+        if self.methods is not None:
+            acr_method = None
+        if self.allow_headers is not None:
+            acr_headers = None
+        elif acr_headers:
+            acr_headers = normalize_header_names(acr_headers)
+        return self._preflight_cache((origin, acr_method, acr_headers))
+
+    def _cached_preflight(
+        self,
+        key: tuple[str | None, str | None, str | None]
+    ) -> Headers:
+        return self._preflight(*key)
+
+    def _preflight(
+        self,
+        origin: str | None,
+        acr_method: str | None,
+        acr_headers: str | None,
+    ) -> Headers:
+        headers = self._preflight_vary
         if origin:
             if self.origin == "*":
-                yield "Access-Control-Allow-Origin", "*"
-            elif origin == self.origin:
-                yield "Access-Control-Allow-Origin", origin
-                yield "Vary", "Origin"
-            else:
-                yield "Access-Control-Allow-Origin", self.origin
-                yield "Vary", "Origin"
+                headers += (("Access-Control-Allow-Origin", "*"),)
+            elif self.allows(origin):
+                headers += (("Access-Control-Allow-Origin", origin),)
+            elif self._origins is None:
+                headers += (("Access-Control-Allow-Origin", self.origin),)
 
         if self.methods is not None:
-            yield "Access-Control-Allow-Methods", ", ".join(self.methods)
+            headers += self._allow_methods
         elif acr_method:
-            yield "Access-Control-Allow-Methods", acr_method
+            headers += (("Access-Control-Allow-Methods", acr_method),)
 
         if self.allow_headers is not None:
-            values = ", ".join(self.allow_headers)
-            yield "Access-Control-Allow-Headers", values
+            headers += self._allow_headers
         elif acr_headers:
-            yield "Access-Control-Allow-Headers", acr_headers
+            headers += ((
+                "Access-Control-Allow-Headers",
+                normalize_header_names(acr_headers)
+            ),)
 
-        if self.expose_headers is not None:
-            values = ", ".join(self.expose_headers)
-            yield "Access-Control-Expose-Headers", values
+        return headers + self._common
@@ -1,26 +1,90 @@
-from .authorization import Authorization
-from .cookies import Cookie, Cookies
-from .query import Query
-from .ranges import Ranges
-from .content_type import ContentType, MediaType, Accept
-from .language import Language, Languages
-from .etag import ETag, ETags
-from .link import Link, Links
-from .utils import parse_list_header, parse_header
-from .utils import parse_http_datetime, parse_host, parse_wsgi_path
-from .utils import encode_uri, serialize_http_datetime
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from .authorization import Authorization
+    from .cache import ParsingCache
+    from .cookies import Cookie, Cookies, RenderedCookie, RequestCookies
+    from .query import Query
+    from .ranges import Ranges, RangeFile, RangePolicy, MultipartRanges
+    from .content_type import (
+        ContentType, MediaType, Accept, SupportedMediaTypes)
+    from .language import Language, Languages, SupportedLanguages
+    from .etag import ETag, ETags, StreamingETag
+    from .link import Link, Links
+    from .utils import parse_list_header, parse_header
+    from .utils import parse_http_datetime, parse_http_timestamp
+    from .utils import parse_host, parse_wsgi_path
+    from .utils import (
+        encode_uri, serialize_http_datetime, canonical_header_name)
+
+
+# Exports are imported on first access : processes only needing
+# `parse_host` or `Query` do not pay for langcodes or biscuits.
+_exports = {
+    "Authorization": "authorization",
+    "ParsingCache": "cache",
+    "Cookie": "cookies",
+    "Cookies": "cookies",
+    "RenderedCookie": "cookies",
+    "RequestCookies": "cookies",
+    "Query": "query",
+    "Ranges": "ranges",
+    "RangeFile": "ranges",
+    "RangePolicy": "ranges",
+    "MultipartRanges": "ranges",
+    "ContentType": "content_type",
+    "MediaType": "content_type",
+    "Accept": "content_type",
+    "SupportedMediaTypes": "content_type",
+    "Language": "language",
+    "Languages": "language",
+    "SupportedLanguages": "language",
+    "ETag": "etag",
+    "ETags": "etag",
+    "StreamingETag": "etag",
+    "Link": "link",
+    "Links": "link",
+    "parse_list_header": "utils",
+    "parse_header": "utils",
+    "parse_http_datetime": "utils",
+    "parse_http_timestamp": "utils",
+    "parse_host": "utils",
+    "parse_wsgi_path": "utils",
+    "encode_uri": "utils",
+    "serialize_http_datetime": "utils",
+    "canonical_header_name": "utils",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module = _exports[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
 
 
 __all__ = [
     "Authorization",
-    "Cookie", "Cookies",
+    "ParsingCache",
+    "Cookie", "Cookies", "RenderedCookie", "RequestCookies",
     "Query",
-    "Ranges",
-    "ContentType", "MediaType", "Accept",
-    "Language", "Languages",
-    "ETag", "ETags",
+    "Ranges", "RangeFile", "RangePolicy", "MultipartRanges",
+    "ContentType", "MediaType", "Accept", "SupportedMediaTypes",
+    "Language", "Languages", "SupportedLanguages",
+    "ETag", "ETags", "StreamingETag",
     "Link", "Links",
     "parse_list_header", "parse_header",
-    "parse_http_datetime", "parse_host", "parse_wsgi_path",
-    "encode_uri", "serialize_http_datetime"
+    "parse_http_datetime", "parse_http_timestamp",
+    "parse_host", "parse_wsgi_path",
+    "encode_uri", "serialize_http_datetime", "canonical_header_name"
 ]
@@ -0,0 +1,51 @@
+from functools import lru_cache
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+
+T = TypeVar("T")
+
+
+class ParsingCache(Generic[T]):
+    """Bounded LRU memoization of a header parser, keyed on the raw value.
+
+    The parsed objects are shared between callers : only use it with
+    parsers returning immutable values, such as `Accept.from_string`,
+    `Languages.from_string` or `ContentType.from_string`.
+    Parsing errors are raised and never cached.
+    Built on `functools.lru_cache`, it is safe to share between threads.
+    """
+    __slots__ = ("parser", "maxsize", "_cached")
+
+    parser: Callable[[Hashable], T]
+    maxsize: int
+
+    def __init__(self, parser: Callable[[Hashable], T], maxsize: int = 128):
+        if maxsize < 1:
+            raise ValueError("Cache size must be a positive integer.")
+        self.parser = parser
+        self.maxsize = maxsize
+        self._cached = lru_cache(maxsize)(parser)
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}: [{len(self)}/{self.maxsize}] "
+            f"hits={self.hits} misses={self.misses}>"
+        )
+
+    def __len__(self):
+        return self._cached.cache_info().currsize
+
+    def __call__(self, value: Hashable) -> T:
+        return self._cached(value)
+
+    @property
+    def hits(self) -> int:
+        return self._cached.cache_info().hits
+
+    @property
+    def misses(self) -> int:
+        return self._cached.cache_info().misses
+
+    def clear(self):
+        self._cached.cache_clear()
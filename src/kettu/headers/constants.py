@@ -9,3 +9,104 @@ class Specificity(int, Enum):
     NONSPECIFIC = 0
     PARTIALLY_SPECIFIC = 1
     SPECIFIC = 2
+
+
+# Registered header names, in their conventional casing,
+# when it differs from `str.title` or when frequently used.
+STANDARD_HEADERS = (
+    "Accept",
+    "Accept-CH",
+    "Accept-Charset",
+    "Accept-Encoding",
+    "Accept-Language",
+    "Accept-Patch",
+    "Accept-Post",
+    "Accept-Ranges",
+    "Access-Control-Allow-Credentials",
+    "Access-Control-Allow-Headers",
+    "Access-Control-Allow-Methods",
+    "Access-Control-Allow-Origin",
+    "Access-Control-Expose-Headers",
+    "Access-Control-Max-Age",
+    "Access-Control-Request-Headers",
+    "Access-Control-Request-Method",
+    "Age",
+    "Allow",
+    "Alt-Svc",
+    "Authorization",
+    "Cache-Control",
+    "Clear-Site-Data",
+    "Connection",
+    "Content-Disposition",
+    "Content-DPR",
+    "Content-Encoding",
+    "Content-ID",
+    "Content-Language",
+    "Content-Length",
+    "Content-Location",
+    "Content-MD5",
+    "Content-Range",
+    "Content-Security-Policy",
+    "Content-Security-Policy-Report-Only",
+    "Content-Type",
+    "Cookie",
+    "Cross-Origin-Embedder-Policy",
+    "Cross-Origin-Opener-Policy",
+    "Cross-Origin-Resource-Policy",
+    "Date",
+    "DNT",
+    "DPR",
+    "ETag",
+    "Expect",
+    "Expect-CT",
+    "Expires",
+    "Forwarded",
+    "From",
+    "Host",
+    "If-Match",
+    "If-Modified-Since",
+    "If-None-Match",
+    "If-Range",
+    "If-Unmodified-Since",
+    "Keep-Alive",
+    "Last-Modified",
+    "Link",
+    "Location",
+    "Max-Forwards",
+    "NEL",
+    "Origin",
+    "Permissions-Policy",
+    "Pragma",
+    "Proxy-Authenticate",
+    "Proxy-Authorization",
+    "Range",
+    "Referer",
+    "Referrer-Policy",
+    "Retry-After",
+    "Server",
+    "Server-Timing",
+    "Set-Cookie",
+    "SourceMap",
+    "Strict-Transport-Security",
+    "TE",
+    "Timing-Allow-Origin",
+    "Trailer",
+    "Transfer-Encoding",
+    "Upgrade",
+    "Upgrade-Insecure-Requests",
+    "User-Agent",
+    "Vary",
+    "Via",
+    "WWW-Authenticate",
+    "Want-Digest",
+    "X-Content-Type-Options",
+    "X-DNS-Prefetch-Control",
+    "X-Forwarded-For",
+    "X-Forwarded-Host",
+    "X-Forwarded-Proto",
+    "X-Frame-Options",
+    "X-Request-ID",
+    "X-Robots-Tag",
+    "X-UA-Compatible",
+    "X-XSS-Protection",
+)
@@ -149,6 +149,50 @@ class MediaType(ContentType):
         return self.mimetype == other
 
 
+class SupportedMediaTypes:
+    """Media types offered by a resource, indexed for negotiation.
+
+    Build it once (per route, for instance) and hand it to
+    `Accept.negotiate` : each accepted media type then costs a single
+    dict lookup instead of a scan of the supported types.
+    """
+    __slots__ = ("candidates", "_exact", "_maintypes")
+
+    candidates: tuple[str | MediaType, ...]
+    _exact: Mapping[str, str | MediaType]
+    _maintypes: Mapping[str, str | MediaType]
+
+    def __init__(self, supported: Sequence[str | MediaType]):
+        self.candidates = tuple(supported)
+        exact = {}
+        maintypes = {}
+        for candidate in self.candidates:
+            if isinstance(candidate, ContentType):
+                mimetype = candidate.mimetype
+            else:
+                mimetype = candidate
+            # The first candidate wins, as it would in a linear scan.
+            exact.setdefault(mimetype, candidate)
+            maintype, slash, _ = mimetype.partition("/")
+            if slash:
+                maintypes.setdefault(maintype, candidate)
+        self._exact = exact
+        self._maintypes = maintypes
+
+    def __len__(self):
+        return len(self.candidates)
+
+    def __iter__(self):
+        return iter(self.candidates)
+
+    def match(self, accepted: MediaType) -> str | MediaType | None:
+        if accepted.specificity == Specificity.NONSPECIFIC:
+            return self.candidates[0] if self.candidates else None
+        if accepted.specificity == Specificity.PARTIALLY_SPECIFIC:
+            return self._maintypes.get(accepted.maintype)
+        return self._exact.get(accepted.mimetype)
+
+
 class Accept(tuple[MediaType, ...]):
 
     def __new__(cls, values: Sequence[MediaType]):
@@ -186,11 +230,22 @@ class Accept(tuple[MediaType, ...]):
             raise ValueError()
         return cls(medias)
 
-    def negotiate(self, supported: Sequence[str | MediaType]):
+    def negotiate(
+            self,
+            supported: Sequence[str | MediaType] | SupportedMediaTypes
+    ):
         if not self:
             if not supported:
                 return None
+            if isinstance(supported, SupportedMediaTypes):
+                return supported.candidates[0]
             return supported[0]
+        if isinstance(supported, SupportedMediaTypes):
+            for accepted in self:
+                candidate = supported.match(accepted)
+                if candidate is not None:
+                    return candidate
+            return None
         for accepted in self:
             for candidate in supported:
                 if accepted.match(candidate):
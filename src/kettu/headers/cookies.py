@@ -1,15 +1,138 @@
-from biscuits import Cookie, parse
+import re
+from typing import TYPE_CHECKING, NamedTuple
+from collections.abc import Iterator, Mapping
+from urllib.parse import unquote
+from kettu.exceptions import HTTPError
 
+if TYPE_CHECKING:
+    from biscuits import Cookie
 
-class Cookies(dict[str, Cookie]):
+
+def __getattr__(name: str):
+    # biscuits is only imported once cookies are actually used.
+    if name == "Cookie":
+        from biscuits import Cookie
+        return Cookie
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class RenderedCookie(NamedTuple):
+    """A cookie rendered once, to be set as is on many responses,
+    such as consent or feature flag cookies.
+    """
+    name: str
+    header: str
+
+    def __str__(self):
+        return self.header
+
+    @classmethod
+    def create(cls, name: str, *args, **kwargs) -> "RenderedCookie":
+        from biscuits import Cookie
+        return cls(name, str(Cookie(name, *args, **kwargs)))
+
+
+class Cookies(dict[str, "Cookie | RenderedCookie"]):
     """A Cookies management class, built on top of biscuits."""
 
     def set(self, name: str, *args, **kwargs):
+        from biscuits import Cookie
         self[name] = Cookie(name, *args, **kwargs)
 
+    def add(self, cookie: "Cookie | RenderedCookie"):
+        self[cookie.name] = cookie
+
     @staticmethod
     def from_string(value: str) -> "Cookies":
+        from biscuits import parse
         return parse(value)
 
     def as_header(self) -> str:
         return ",".join(str(c) for c in self.values())
+
+    def as_headers(self) -> Iterator[str]:
+        """One `Set-Cookie` value per cookie : they can't be joined."""
+        for cookie in self.values():
+            yield str(cookie)
+
+
+_escaped = re.compile(r"\\(.)")
+
+
+class RequestCookies(Mapping[str, str]):
+    """Request cookies, decoded lazily.
+
+    The header is scanned once for the names and value offsets :
+    a value is only unquoted and decoded when accessed.
+    Headers longer than `max_size` characters or holding more than
+    `max_count` `;` separated pairs, duplicates included, are refused
+    with a 431 HTTPError.
+    """
+    __slots__ = ("header", "_offsets", "_decoded")
+
+    header: str
+    _offsets: dict[str, tuple[int, int]]
+    _decoded: dict[str, str]
+
+    def __init__(
+            self,
+            header: str,
+            max_size: int | None = None,
+            max_count: int | None = None
+    ):
+        if max_size is not None and len(header) > max_size:
+            raise HTTPError(431, body="Cookie header is too large.")
+        self.header = header
+        self._decoded = {}
+        self._offsets = offsets = {}
+        find = header.find
+        length = len(header)
+        pos = 0
+        count = 0
+        while pos < length:
+            # Every pair scanned counts, even if its name is a duplicate.
+            count += 1
+            if max_count is not None and count > max_count:
+                raise HTTPError(431, body="Too many cookies.")
+            end = find(";", pos)
+            if end == -1:
+                end = length
+            equal = find("=", pos, end)
+            if equal != -1:
+                name = header[pos:equal].strip()
+                if name:
+                    # As with biscuits, the last occurrence wins.
+                    offsets[name] = (equal + 1, end)
+            pos = end + 1
+
+    @classmethod
+    def from_string(cls, value: str, **limits) -> "RequestCookies":
+        return cls(value, **limits)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: [{len(self)}]>"
+
+    def __getitem__(self, name: str) -> str:
+        try:
+            return self._decoded[name]
+        except KeyError:
+            pass
+        start, end = self._offsets[name]
+        value = self.header[start:end].strip()
+        if len(value) >= 2 and value[0] == value[-1] == '"':
+            value = value[1:-1]
+            if "\\" in value:
+                value = _escaped.sub(r"\1", value)
+        if "%" in value:
+            value = unquote(value)
+        self._decoded[name] = value
+        return value
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._offsets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
@@ -1,4 +1,8 @@
+import os
+import re
+from hashlib import blake2b
 from typing import NamedTuple
+from collections.abc import Iterable, Iterator
 
 
 class ETag(NamedTuple):
@@ -26,6 +30,26 @@ class ETag(NamedTuple):
         # Etag value SHOULD be quoted.
         return cls(value.strip('"'), weak=weak)
 
+    @classmethod
+    def from_body(
+            cls, body: bytes | Iterable[bytes], digest_size: int = 16
+    ) -> 'ETag':
+        """Strong ETag hashing the body chunk by chunk."""
+        if isinstance(body, (bytes, bytearray, memoryview)):
+            return cls(blake2b(body, digest_size=digest_size).hexdigest())
+        digest = blake2b(digest_size=digest_size)
+        for chunk in body:
+            digest.update(chunk)
+        return cls(digest.hexdigest())
+
+    @classmethod
+    def from_stat(cls, stat: os.stat_result) -> 'ETag':
+        """Weak ETag of a file, from its inode, mtime and size."""
+        return cls(
+            f"{stat.st_ino:x}-{stat.st_mtime_ns:x}-{stat.st_size:x}",
+            weak=True
+        )
+
     def compare(self, other: 'ETag') -> bool:
         return self.value == other.value and not (self.weak or other.weak)
 
@@ -41,29 +65,95 @@ class ETag(NamedTuple):
         return cls(value).as_header()
 
 
+class StreamingETag:
+    """Strong ETag computed while the wrapped body is iterated.
+
+    The ETag is only known once the body is exhausted : use it for
+    trailers or caches, when the body can't be buffered to be hashed.
+    """
+    __slots__ = ("body", "_digest", "_etag")
+
+    def __init__(self, body: Iterable[bytes], digest_size: int = 16):
+        self.body = body
+        self._digest = blake2b(digest_size=digest_size)
+        self._etag = None
+
+    def __iter__(self) -> Iterator[bytes]:
+        update = self._digest.update
+        for chunk in self.body:
+            update(chunk)
+            yield chunk
+        self._etag = ETag(self._digest.hexdigest())
+
+    @property
+    def etag(self) -> ETag:
+        if self._etag is None:
+            raise ValueError("The body was not entirely consumed.")
+        return self._etag
+
+
+# Quoted entity-tags may contain commas. Unquoted values are tolerated.
+# Each one must be followed by `OWS "," OWS` or the end of the header,
+# and empty list elements are skipped, as RFC 9110 § 5.6.1.2 allows.
+_etag_token = re.compile(
+    r'[\s,]*(?:(W/|w/)?"([^"]*)"|([^\s,"]+))\s*(?:,|\Z)')
+_list_end = re.compile(r'[\s,]*\Z')
+
+
 class ETags(frozenset[ETag]):
     # IfMatch / IfMatchNone
 
+    # Maximum number of entity-tags parsed from a header, if not None.
+    max_tags: int | None = None
+
+    # A bare `*` matches any entity-tag, while `"*"` is an opaque one.
+    wildcard: bool = False
+
+    @classmethod
+    def any(cls) -> 'ETags':
+        etags = cls()
+        etags.wildcard = True
+        return etags
+
     def as_header(self) -> str:
+        if self.wildcard:
+            return '*'
         return ','.join((etag.as_header() for etag in self))
 
     @classmethod
-    def from_string(cls, header: str) -> frozenset[ETag]:
-        if ',' not in header:
-            header = header.strip()
-            if header:
-                etag = ETag.from_string(header)
-                return cls((etag,))
-
-        etags = []
-        values = header.split(',')
-        for value in values:
-            value = value.strip()
-            if value:
-                etags.append(ETag.from_string(value))
+    def from_string(
+            cls, header: str, max_tags: int | None = None
+    ) -> frozenset[ETag]:
+        if max_tags is None:
+            max_tags = cls.max_tags
+        if header.strip() == '*':
+            return cls.any()
+
+        def tokens():
+            count = 0
+            pos = 0
+            while not _list_end.match(header, pos):
+                match = _etag_token.match(header, pos)
+                if match is None:
+                    raise ValueError(
+                        f"Malformed entity-tag at position {pos}.")
+                pos = match.end()
+                count += 1
+                if max_tags is not None and count > max_tags:
+                    raise ValueError(
+                        f"More than {max_tags} entity-tags.")
+                weak, quoted, unquoted = match.groups()
+                if quoted is not None:
+                    yield ETag(quoted, weak=weak is not None)
+                elif unquoted == '*':
+                    raise ValueError("Wildcard must be alone.")
+                else:
+                    yield ETag.from_string(unquoted)
+
+        etags = cls(tokens())
         if not etags:
             raise ValueError()
-        return cls(etags)
+        return etags
 
     @classmethod
     def caster(cls, value: "str | ETags"):
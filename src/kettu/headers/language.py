@@ -1,8 +1,13 @@
 from typing import Any, Union, Sequence
 from langcodes import Language as LangCode
+from kettu.headers.cache import ParsingCache
 from kettu.headers.constants import WEIGHT_PARAM, Specificity
 
 
+# Language tags seen in Accept-Language headers repeat a lot.
+language_tags = ParsingCache(LangCode.get, maxsize=256)
+
+
 class Language:
     __slots__ = ("language", "quality", "specificity")
 
@@ -17,7 +22,7 @@ class Language:
     ):
         self.quality = quality
         if locale != "*":
-            self.language = LangCode.get(locale)
+            self.language = language_tags(locale)
             self.specificity = (
                 Specificity.SPECIFIC if (
                     self.language.territory or self.language.script
@@ -71,7 +76,7 @@ class Language:
             return True
 
         if isinstance(other, str):
-            language = LangCode.get(other)
+            language = language_tags(other)
         else:
             language = other.language
 
@@ -84,6 +89,63 @@ class Language:
         return language == self.language
 
 
+class SupportedLanguages:
+    """Locales offered by a resource, resolved once and indexed for
+    negotiation : `Languages.negotiate` then does no langcodes work.
+    """
+    __slots__ = ("candidates", "_languages", "_loose", "_exact")
+
+    candidates: tuple[str | Language, ...]
+    _languages: dict[str, tuple[int, str | Language]]
+    _loose: dict[str, tuple[int, str | Language]]
+    _exact: dict[LangCode, tuple[int, str | Language]]
+
+    def __init__(self, supported: Sequence[str | Language]):
+        self.candidates = tuple(supported)
+        languages = {}
+        loose = {}
+        exact = {}
+        for index, candidate in enumerate(self.candidates):
+            if isinstance(candidate, str):
+                language = LangCode.get(candidate)
+            else:
+                language = candidate.language
+                if language is None:
+                    continue
+            # The first candidate wins, as it would in a linear scan.
+            entry = (index, candidate)
+            languages.setdefault(language.language, entry)
+            if not language.territory or not language.script:
+                # Such candidates only compare on the language.
+                loose.setdefault(language.language, entry)
+            else:
+                exact.setdefault(language, entry)
+        self._languages = languages
+        self._loose = loose
+        self._exact = exact
+
+    def __len__(self):
+        return len(self.candidates)
+
+    def __iter__(self):
+        return iter(self.candidates)
+
+    def match(self, accepted: Language) -> str | Language | None:
+        if accepted.specificity == Specificity.NONSPECIFIC:
+            return self.candidates[0] if self.candidates else None
+        language = accepted.language
+        if accepted.specificity == Specificity.PARTIALLY_SPECIFIC:
+            entry = self._languages.get(language.language)
+            return entry[1] if entry is not None else None
+        loose = self._loose.get(language.language)
+        exact = self._exact.get(language)
+        if loose is None:
+            return exact[1] if exact is not None else None
+        if exact is None or loose[0] < exact[0]:
+            return loose[1]
+        return exact[1]
+
+
 class Languages(tuple[Language, ...]):
 
     def __new__(cls, values: Sequence[Language]):
@@ -121,11 +183,22 @@ class Languages(tuple[Language, ...]):
             raise ValueError()
         return cls(langs)
 
-    def negotiate(self, supported: Sequence[str | Language]):
+    def negotiate(
+            self,
+            supported: Sequence[str | Language] | SupportedLanguages
+    ):
         if not self:
             if not supported:
                 return None
+            if isinstance(supported, SupportedLanguages):
+                return supported.candidates[0]
             return supported[0]
+        if isinstance(supported, SupportedLanguages):
+            for accepted in self:
+                candidate = supported.match(accepted)
+                if candidate is not None:
+                    return candidate
+            return None
         for accepted in self:
             for candidate in supported:
                 if accepted.match(candidate):
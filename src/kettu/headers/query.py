@@ -1,5 +1,6 @@
-import urllib.parse
-from typing import Sequence, Literal
+from array import array
+from urllib.parse import quote, unquote
+from typing import Any, Callable, Sequence, Literal
 from frozendict import frozendict
 
 
@@ -7,6 +8,11 @@ class Query(frozendict[str, Sequence[str]]):
     TRUE_STRINGS: set[str] = frozenset(("t", "true", "yes", "1", "on"))
     FALSE_STRINGS: set[str] = frozenset(("f", "false", "no", "0", "off"))
     NONE_STRINGS: set[str] = frozenset(("n", "none", "null"))
+    TRACKING_PARAMS: set[str] = frozenset((
+        "fbclid", "gclid", "dclid", "gbraid", "wbraid", "msclkid",
+        "yclid", "twclid", "igshid", "mc_cid", "mc_eid", "_ga", "_gl",
+    ))
+    TRACKING_PREFIXES: tuple[str, ...] = ("utm_",)
 
     def get(self, name: str, default=None):
         """Return the first value of the found list."""
@@ -33,6 +39,124 @@ class Query(frozendict[str, Sequence[str]]):
     def as_float(self, key: str) -> float:
         return float(self[key][0])
 
+    def is_tracking(self, name: str) -> bool:
+        return (
+            name in self.TRACKING_PARAMS or
+            name.startswith(self.TRACKING_PREFIXES)
+        )
+
+    def canonical(self, exclude_tracking: bool = True) -> str:
+        """Canonical query string, to be used as a cache key : names
+        are sorted, values keep their order, everything is
+        percent-encoded. The result is memoized on the instance.
+        """
+        key = "_canonical_untracked" if exclude_tracking else "_canonical"
+        # The instance is immutable : its `__dict__` is only a cache.
+        memo = self.__dict__
+        try:
+            return memo[key]
+        except KeyError:
+            pass
+        fields = []
+        for name in sorted(self.keys()):
+            if exclude_tracking and self.is_tracking(name):
+                continue
+            prefix = quote(name, safe="") + "="
+            fields.extend(
+                prefix + quote(value, safe="")
+                for value in self[name]
+            )
+        memo[key] = canonical = "&".join(fields)
+        return canonical
+
+    @staticmethod
+    def _parse_numbers(numpy, values: Sequence[str], dtype):
+        """Parse numbers with `numpy.fromstring`, or return None if the
+        result might differ from a cast per value.
+        """
+        joined = ",".join(values)
+        if joined.count(",") != len(values) - 1:
+            # A value holds a separator.
+            return None
+        wide = "float64" if dtype.kind == "f" else "int64"
+        try:
+            result = numpy.fromstring(joined, dtype=wide, sep=",")
+        except ValueError:
+            return None
+        if len(result) != len(values):
+            return None
+        if dtype.kind == "f":
+            return result.astype(dtype, copy=False)
+        # Out of range integers saturate instead of failing.
+        low, high = result.min(), result.max()
+        bounds, saturated = numpy.iinfo(dtype), numpy.iinfo(wide)
+        if (low < bounds.min or high > bounds.max or
+                low == saturated.min or high == saturated.max):
+            return None
+        return result.astype(dtype, copy=False)
+
+    @staticmethod
+    def _cast_error(
+            key: str, values: Sequence[str], cast: Callable[[str], Any],
+            kind: str
+    ) -> ValueError:
+        for index, value in enumerate(values):
+            try:
+                cast(value)
+            except (ValueError, OverflowError):
+                return ValueError(
+                    f"Can't cast {value!r} at position {index} "
+                    f"of {key!r} to {kind}.")
+        return ValueError(f"Can't cast {key!r} values to {kind}.")
+
+    def as_ints(self, key: str, typecode: str = "q") -> array:
+        """All the values, as an array of integers.
+
+        Each value is still cast by `int` : the gain is a compact
+        result, not speed. See `as_ndarray` for the latter.
+        """
+        values = self[key]
+        try:
+            # Building from a list is faster than from an iterator.
+            return array(typecode, list(map(int, values)))
+        except (ValueError, OverflowError):
+            raise self._cast_error(
+                key, values, lambda value: array(typecode, (int(value),)),
+                f"{typecode!r} array"
+            ) from None
+
+    def as_floats(self, key: str, typecode: str = "d") -> array:
+        """All the values, as an array of floats."""
+        values = self[key]
+        try:
+            return array(typecode, map(float, values))
+        except ValueError:
+            raise self._cast_error(
+                key, values, float, f"{typecode!r} array") from None
+
+    def as_ndarray(self, key: str, dtype: str = "int64"):
+        """All the values, as a NumPy array. Requires NumPy.
+
+        Values are parsed in C from a single joined string, falling back
+        to a cast per value when the fast path can't vouch for the result.
+        """
+        import numpy
+
+        values = self[key]
+        dtype = numpy.dtype(dtype)
+        result = None
+        if dtype.kind in "iuf" and values:
+            result = self._parse_numbers(numpy, values, dtype)
+        if result is not None:
+            return result
+        try:
+            return numpy.array(values, dtype=dtype)
+        except (ValueError, OverflowError):
+            raise self._cast_error(
+                key, values, lambda value: numpy.array(value, dtype=dtype),
+                str(dtype)
+            ) from None
+
     @classmethod
     def from_string(
         cls,
@@ -43,18 +167,45 @@ class Query(frozendict[str, Sequence[str]]):
         errors: Literal["strict", "replace", "ignore"] = "replace",
         max_num_fields: int = None,
         separator: str = "&",
+        max_length: int = None,
     ) -> "Query":
+        """Parse a query string, as `urllib.parse.parse_qs` would.
+        Names and values without `%` or `+` are not decoded.
+        """
         if not value:
             return cls()
+        if max_length is not None and len(value) > max_length:
+            raise ValueError("Query string is too long.")
+        if (max_num_fields is not None and
+                value.count(separator) >= max_num_fields):
+            raise ValueError("Max number of fields exceeded")
+
+        # Values are stored as a string, then a list when repeated.
+        fields = {}
+        for field in value.split(separator):
+            name, equal, val = field.partition("=")
+            if not equal:
+                if strict_parsing:
+                    raise ValueError(f"bad query field: {field!r}")
+                if not field or not keep_blank_values:
+                    continue
+            elif not val and not keep_blank_values:
+                continue
+            if "%" in name or "+" in name:
+                name = unquote(
+                    name.replace("+", " "), encoding=encoding, errors=errors)
+            if "%" in val or "+" in val:
+                val = unquote(
+                    val.replace("+", " "), encoding=encoding, errors=errors)
+            current = fields.get(name)
+            if current is None:
+                fields[name] = val
+            elif type(current) is list:
+                current.append(val)
+            else:
+                fields[name] = [current, val]
+
         return cls(
-            (key, tuple(val))
-            for key, val in urllib.parse.parse_qs(
-                value,
-                keep_blank_values=keep_blank_values,
-                strict_parsing=strict_parsing,
-                encoding=encoding,
-                errors=errors,
-                max_num_fields=max_num_fields,
-                separator=separator,
-            ).items()
+            (name, (val,) if type(val) is str else tuple(val))
+            for name, val in fields.items()
         )
@@ -1,12 +1,50 @@
-from typing import NamedTuple, Sequence
+import os
+import mmap
+from itertools import islice
+from operator import le
+from typing import Literal, NamedTuple, Sequence
+from collections.abc import Callable, Iterator
 from kettu.exceptions import HTTPError
 
 
+class RangePolicy(NamedTuple):
+    """Limits protecting against abusive range requests.
+
+    `max_ranges` caps the number of requested ranges, `max_ratio` the
+    total of served bytes relative to the resource size and ranges
+    closer than `coalesce_gap` bytes are merged.
+    When a limit is exceeded, the full representation should be served
+    (`fallback=200`) or the request refused (`fallback=416`).
+    """
+    max_ranges: int | None = None
+    max_ratio: float | None = None
+    coalesce_gap: int | None = None
+    fallback: Literal[200, 416] = 200
+
+    def exceeded(self) -> None:
+        if self.fallback == 416:
+            raise HTTPError(416)
+        return None
+
+
 class Ranges(NamedTuple):
     unit: str
     values: tuple[tuple[int, int], ...]
 
-    def resolve(self, size: int, merge: bool = False) -> 'Ranges':
+    def resolve(
+            self,
+            size: int,
+            merge: bool = False,
+            policy: RangePolicy | None = None
+    ) -> 'Ranges | None':
+        """Resolve the ranges against the resource size.
+        Returns None if, according to the policy, the full
+        representation should be served instead.
+        """
+        if (policy is not None and policy.max_ranges is not None and
+                len(self.values) > policy.max_ranges):
+            return policy.exceeded()
+
         max_size = size - 1
         ranges = []
         for first, last in self.values:
@@ -18,10 +56,35 @@ class Ranges(NamedTuple):
                 last = max_size
             elif last > max_size:
                 last = max_size
+            if first > last:
+                # Unsatisfiable range, starting past the end.
+                continue
             ranges.append((first, last))
-        if merge:
+        if not ranges:
+            raise HTTPError(416)
+        if policy is not None and policy.coalesce_gap is not None:
+            ranges = consolidate_ranges(ranges, gap=policy.coalesce_gap)
+        elif merge:
             ranges = consolidate_ranges(ranges)
-        return self._replace(values=tuple(ranges))
+        ranges = tuple(ranges)
+        if policy is not None and policy.max_ratio is not None:
+            total = sum(last - first + 1 for first, last in ranges)
+            if total > size * policy.max_ratio:
+                return policy.exceeded()
+        return self._replace(values=ranges)
+
+    def multipart(
+            self,
+            size: int,
+            content_type: str,
+            boundary: str,
+            merge: bool = False,
+            policy: RangePolicy | None = None
+    ) -> "MultipartRanges | None":
+        resolved = self.resolve(size, merge=merge, policy=policy)
+        if resolved is None:
+            return None
+        return MultipartRanges(resolved, size, content_type, boundary)
 
     @classmethod
     def from_string(cls, value: str | bytes) -> "Ranges":
@@ -60,11 +123,15 @@ class Ranges(NamedTuple):
         return cls(unit=unit, values=tuple(ranges))
 
 
-def consolidate_ranges(ranges: Sequence[tuple[int, int]]):
-    ranges = iter(sorted(ranges))
+def consolidate_ranges(ranges: Sequence[tuple[int, int]], gap: int = 0):
+    if not ranges:
+        return
+    if not all(map(le, ranges, islice(ranges, 1, None))):
+        ranges = sorted(ranges)
+    ranges = iter(ranges)
     current_start, current_stop = next(ranges)
     for start, stop in ranges:
-        if start > current_stop + 1:
+        if start > current_stop + gap + 1:
             # Gap between segments: output current segment and start a new one.
             yield current_start, current_stop
             current_start, current_stop = start, stop
@@ -78,12 +145,171 @@ def bytes_multipart(
         body: bytes | str,
         content_type: str,
         ranges: Ranges,
-        max_size: int):
+        size: int):
     boundary = yield
-    chunks = ranges.resolve(max_size)
-    yield f"--{boundary}\r\n"
+    chunks = ranges.resolve(size)
     for first, last in chunks.values:
-        yield f"Content-Type: {content_type}\r\n"
-        yield f"Content-Range: bytes {first}-{last}/{max_size}\r\n\r\n"
-        yield body[first:last]
         yield f"--{boundary}\r\n"
+        yield f"Content-Type: {content_type}\r\n"
+        yield f"Content-Range: bytes {first}-{last}/{size}\r\n\r\n"
+        yield body[first:last + 1]
+        yield "\r\n"
+    yield f"--{boundary}--\r\n"
+
+
+FileSpan = tuple[int, int, int]
+Slicer = Callable[[int, int], bytes | memoryview | FileSpan]
+
+
+class MultipartRanges:
+    """A `multipart/byteranges` body with its framing precomputed.
+
+    The part headers are rendered once, as bytes, so the exact
+    `Content-Length` is known before anything is sent.
+    Ranges are expected to be resolved against `size`.
+    """
+    __slots__ = (
+        "boundary", "content_type", "size", "parts", "trailer",
+        "content_length"
+    )
+
+    boundary: str
+    content_type: str
+    size: int
+    parts: tuple[tuple[bytes, int, int], ...]
+    trailer: bytes
+    content_length: int
+
+    def __init__(
+            self,
+            ranges: Ranges,
+            size: int,
+            content_type: str,
+            boundary: str
+    ):
+        self.boundary = boundary
+        self.content_type = content_type
+        self.size = size
+        delimiter = f"--{boundary}\r\nContent-Type: {content_type}\r\n"
+        self.parts = tuple(
+            ((
+                delimiter +
+                f"Content-Range: bytes {first}-{last}/{size}\r\n\r\n"
+            ).encode("latin-1"), first, last)
+            for first, last in ranges.values
+        )
+        self.trailer = f"--{boundary}--\r\n".encode("latin-1")
+        self.content_length = len(self.trailer) + sum(
+            len(header) + last - first + 3  # range length and CRLF.
+            for header, first, last in self.parts
+        )
+
+    @property
+    def media_type(self) -> str:
+        return f"multipart/byteranges; boundary={self.boundary}"
+
+    def chunks(
+            self,
+            source: bytes | memoryview | Slicer
+    ) -> Iterator[bytes | memoryview | FileSpan]:
+        """Body chunks, suitable for a single `writev`.
+        `source` is either the whole resource or a callable returning
+        the content of the `(first, last)` range.
+        """
+        if callable(source):
+            slicer = source
+        else:
+            view = memoryview(source)
+
+            def slicer(first: int, last: int) -> memoryview:
+                return view[first:last + 1]
+
+        for header, first, last in self.parts:
+            yield header
+            yield slicer(first, last)
+            yield b"\r\n"
+        yield self.trailer
+
+
+class RangeFile:
+    """Byte ranges of a file, served without reading it in memory.
+
+    Ranges are either returned as `memoryview` slices of a read-only
+    mmap of the file, or as `(fd, offset, count)` spans that a server can
+    hand over to `os.sendfile`.
+    Memoryviews must be released before the file is closed.
+    """
+    __slots__ = ("fd", "size", "_owned", "_mmap")
+
+    fd: int
+    size: int
+
+    def __init__(self, file: str | os.PathLike | int):
+        if isinstance(file, int):
+            self.fd = file
+            self._owned = False
+        else:
+            self.fd = os.open(file, os.O_RDONLY)
+            self._owned = True
+        self.size = os.fstat(self.fd).st_size
+        self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Views are still alive : the map is closed with them.
+                pass
+            self._mmap = None
+        if self._owned and self.fd != -1:
+            os.close(self.fd)
+            self.fd = -1
+
+    def resolve(
+            self,
+            ranges: Ranges,
+            merge: bool = True,
+            policy: RangePolicy | None = None
+    ) -> Ranges | None:
+        if ranges.unit != "bytes":
+            raise HTTPError(416)
+        return ranges.resolve(self.size, merge=merge, policy=policy)
+
+    def view(self, first: int, last: int) -> memoryview:
+        if self._mmap is None:
+            self._mmap = mmap.mmap(self.fd, 0, access=mmap.ACCESS_READ)
+        return memoryview(self._mmap)[first:last + 1]
+
+    def span(self, first: int, last: int) -> FileSpan:
+        return self.fd, first, last - first + 1
+
+    def slices(
+            self,
+            ranges: Ranges,
+            sendfile: bool = False
+    ) -> Iterator[memoryview | FileSpan]:
+        slicer = self.span if sendfile else self.view
+        for first, last in self.resolve(ranges).values:
+            yield slicer(first, last)
+
+    def multipart(
+            self,
+            ranges: Ranges,
+            content_type: str,
+            boundary: str,
+            sendfile: bool = False
+    ) -> Iterator[bytes | memoryview | FileSpan]:
+        """`multipart/byteranges` body : the framing is yielded as bytes,
+        the file content as memoryviews or sendfile spans.
+        Use `Ranges.multipart` to know the content length beforehand.
+        """
+        body = MultipartRanges(
+            self.resolve(ranges), self.size, content_type, boundary)
+        return body.chunks(self.span if sendfile else self.view)
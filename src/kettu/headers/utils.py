@@ -1,9 +1,12 @@
 import re
-from urllib.request import parse_http_list
+import sys
+import time
+import calendar
 from urllib.parse import quote, urlsplit, urlunsplit
 from pathlib import PurePosixPath
 from datetime import datetime, timezone
-from email.utils import parsedate_to_datetime
+from kettu.headers.cache import ParsingCache
+from kettu.headers.constants import STANDARD_HEADERS
 
 
 # Borrowed from Sanic
@@ -18,6 +21,39 @@ _safe_uri_query_chars = "?/="
 _safe_uri_fragment_chars = "?/#+&="
 
 
+# Canonical header names, reachable as given, lowercased or titled.
+_canonical_names: dict[str, str] = {}
+for _name in STANDARD_HEADERS:
+    _name = sys.intern(_name)
+    _canonical_names[_name] = _name
+    _canonical_names[_name.lower()] = _name
+    _canonical_names[_name.title()] = _name
+del _name
+
+UNKNOWN_NAMES_MAX = 1024
+_unknown_names: dict[str, str] = {}
+
+
+def canonical_header_name(name: str) -> str:
+    """Conventional casing of a header name, `ETag` and not `Etag`.
+    Names outside the standard registry are titled.
+    """
+    try:
+        return _canonical_names[name]
+    except KeyError:
+        pass
+    try:
+        return _unknown_names[name]
+    except KeyError:
+        pass
+    canonical = _canonical_names.get(name.lower())
+    if canonical is None:
+        canonical = sys.intern(name.title())
+    if len(_unknown_names) < UNKNOWN_NAMES_MAX:
+        _unknown_names[name] = canonical
+    return canonical
+
+
 def dequote(value: str) -> str:
     """If a value has double quotes around it, remove them.
     """
@@ -38,6 +74,8 @@ def encode_uri(value: str):
 
 
 def parse_list_header(value: str) -> tuple[str]:
+    # urllib.request is slow to import and only needed here.
+    from urllib.request import parse_http_list
     return tuple((dequote(header) for header in parse_http_list(value)))
 
 
@@ -56,18 +94,96 @@ def parse_header(value: str) -> tuple[str, dict[str, str]]:
     return value.strip().lower(), options
 
 
-parse_http_datetime = parsedate_to_datetime
+# Not locale dependent, unlike `strftime`.
+_weekdays = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_months = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"
+)
+
+_month_numbers = {name: number for number, name in enumerate(_months, 1)}
+
+# RFC 9110 § 5.6.7 : IMF-fixdate and the obsolete RFC 850 and asctime.
+_imf_fixdate = re.compile(
+    r"[A-Z][a-z]{2}, (\d{2}) ([A-Z][a-z]{2}) (\d{4}) "
+    r"(\d{2}):(\d{2}):(\d{2}) GMT")
+_rfc850_date = re.compile(
+    r"[A-Z][a-z]{5,8}, (\d{2})-([A-Z][a-z]{2})-(\d{2}) "
+    r"(\d{2}):(\d{2}):(\d{2}) GMT")
+_asctime_date = re.compile(
+    r"[A-Z][a-z]{2} ([A-Z][a-z]{2}) ([ \d]\d) "
+    r"(\d{2}):(\d{2}):(\d{2}) (\d{4})")
+
+
+def _parse_http_timestamp(value: str) -> int:
+    if matched := _imf_fixdate.fullmatch(value):
+        day, month, year, hour, minute, second = matched.groups()
+    elif matched := _rfc850_date.fullmatch(value):
+        day, month, year, hour, minute, second = matched.groups()
+        year = int(year)
+        year += 1900 if year > 68 else 2000
+    elif matched := _asctime_date.fullmatch(value):
+        month, day, hour, minute, second, year = matched.groups()
+    else:
+        # Lenient RFC 2822 parsing, for non conforming clients.
+        from email.utils import parsedate_tz
+        parsed = parsedate_tz(value)
+        if parsed is None:
+            raise ValueError(f"Invalid HTTP date: {value!r}.")
+        try:
+            return calendar.timegm(parsed[:6]) - (parsed[9] or 0)
+        except (OverflowError, ValueError):
+            raise ValueError(f"Invalid HTTP date: {value!r}.") from None
+
+    month = _month_numbers.get(month)
+    day, hour, minute, second = int(day), int(hour), int(minute), int(second)
+    if (month is None or not 1 <= day <= 31 or hour > 23 or
+            minute > 59 or second > 60):
+        raise ValueError(f"Invalid HTTP date: {value!r}.")
+    return calendar.timegm((int(year), month, day, hour, minute, second))
+
+
+# Conditional requests repeat the same few dates.
+http_timestamps = ParsingCache(_parse_http_timestamp, maxsize=64)
+
+
+def parse_http_timestamp(value: str) -> int:
+    """Epoch seconds of an HTTP date, comparable with file mtimes.
+    """
+    return http_timestamps(value)
+
+
+def parse_http_datetime(value: str) -> datetime:
+    return datetime.fromtimestamp(
+        parse_http_timestamp(value), tz=timezone.utc)
 
 
-def serialize_http_datetime(dt: datetime) -> str:
-    """Returns an RFC 1123 datetime string
+# Last formatted second, as (epoch seconds, formatted string).
+_last_http_datetime: tuple[int, str] = (-1, "")
+
+
+def serialize_http_datetime(dt: datetime | int | float) -> str:
+    """Returns an RFC 1123 datetime string.
+    Accepts datetimes or epoch timestamps, such as `os.stat` mtimes.
     """
-    if dt.tzinfo is None:
+    global _last_http_datetime
+
+    if isinstance(dt, datetime):
         # If the datetime is naive, we assume its utc.
-        dt = dt.replace(tzinfo=timezone.utc)
+        timestamp = calendar.timegm(dt.utctimetuple())
     else:
-        dt = dt.astimezone(timezone.utc)
-    return dt.strftime('%a, %d %b %Y %H:%M:%S GMT')
+        timestamp = int(dt)
+    second, formatted = _last_http_datetime
+    if second == timestamp:
+        return formatted
+    year, month, day, hour, minute, sec, weekday, _, _ = time.gmtime(
+        timestamp)
+    formatted = (
+        f"{_weekdays[weekday]}, {day:02d} {_months[month - 1]} {year} "
+        f"{hour:02d}:{minute:02d}:{sec:02d} GMT"
+    )
+    _last_http_datetime = (timestamp, formatted)
+    return formatted
 
 
 def parse_host(value: str) -> tuple[str | None, int | None]:
@@ -1,29 +1,116 @@
+import codecs
 import typing as t
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
 from io import BytesIO
+from tempfile import SpooledTemporaryFile
 from multifruits import Parser, extract_filename, parse_content_disposition
+from kettu.exceptions import HTTPError
 
 
 class Multipart:
-    """Responsible for the parsing of multipart encoded body."""
+    """Responsible for the parsing of multipart encoded body.
+
+    File parts are kept in memory unless `spool_max_size` is given : they
+    are then written to a `SpooledTemporaryFile` that rolls over to disk
+    past that many bytes.
+    The optional `max_part_size`, `max_body_size` and `max_parts` limits
+    abort the parsing with a 413 HTTPError as soon as they are exceeded.
+    """
 
     __slots__ = (
         "form",
         "files",
+        "encoding",
+        "spool_max_size",
+        "max_part_size",
+        "max_body_size",
+        "max_parts",
         "_parser",
         "_current",
         "_current_headers",
         "_current_params",
+        "_current_size",
+        "_decoder",
+        "_body_size",
+        "_parts",
+        "_emitted",
     )
 
-    def __init__(self, content_type: str):
+    def __init__(
+            self,
+            content_type: str,
+            *,
+            encoding: str = "utf-8",
+            spool_max_size: int | None = None,
+            max_part_size: int | None = None,
+            max_body_size: int | None = None,
+            max_parts: int | None = None,
+    ):
         self._parser = Parser(self, content_type.encode())
         self.form: list[tuple[str, t.Any]] = []
+        self.encoding = encoding
+        self.spool_max_size = spool_max_size
+        self.max_part_size = max_part_size
+        self.max_body_size = max_body_size
+        self.max_parts = max_parts
+        self._current = None
+        self._body_size = 0
+        self._parts = 0
+        self._emitted = 0
 
     def feed_data(self, data: bytes):
+        if self.max_body_size is not None:
+            self._body_size += len(data)
+            if self._body_size > self.max_body_size:
+                self._abort("Request body is too large.")
         self._parser.feed_data(data)
 
+    async def feed_stream(
+            self,
+            source: (Callable[[], Awaitable[t.Mapping[str, t.Any]]] |
+                     AsyncIterable[bytes])
+    ) -> AsyncIterator[tuple[str, t.Any]]:
+        """Feed the parser from an ASGI `receive` callable or an async
+        iterable of chunks, yielding each form part once it is complete.
+
+        The next chunk is only read when the consumer asks for the next
+        part : the reading pace follows the consumer.
+        """
+        self._emitted = len(self.form)
+        if callable(source):
+            while True:
+                message = await source()
+                if message["type"] == "http.disconnect":
+                    raise HTTPError(400, body="Client disconnected.")
+                self.feed_data(message.get("body", b""))
+                while self._emitted < len(self.form):
+                    self._emitted += 1
+                    yield self.form[self._emitted - 1]
+                if not message.get("more_body", False):
+                    break
+        else:
+            async for chunk in source:
+                self.feed_data(chunk)
+                while self._emitted < len(self.form):
+                    self._emitted += 1
+                    yield self.form[self._emitted - 1]
+
+    def _abort(self, reason: str):
+        if self._current is not None and not isinstance(self._current, list):
+            self._current.close()
+        self._current = None
+        # Parts already handed to the consumer are its own to close.
+        for _, value in self.form[self._emitted:]:
+            if not isinstance(value, str):
+                value.close()
+        raise HTTPError(413, body=reason)
+
     def on_part_begin(self):
+        self._parts += 1
+        if self.max_parts is not None and self._parts > self.max_parts:
+            self._abort("Too many parts in multipart body.")
         self._current_headers = {}
+        self._current_size = 0
 
     def on_header(self, field: bytes, value: bytes):
         self._current_headers[field] = value
@@ -37,29 +124,40 @@ class Multipart:
 
         self._current_params = params
         if b"Content-Type" in self._current_headers:
-            self._current = BytesIO()
+            if self.spool_max_size is None:
+                self._current = BytesIO()
+            else:
+                self._current = SpooledTemporaryFile(
+                    max_size=self.spool_max_size)
             self._current.filename = extract_filename(params)
             self._current.size = 0
             self._current.content_type = self._current_headers[b"Content-Type"]
             self._current.params = params
         else:
-            self._current = ""
+            # Chunks may split multibyte sequences : decode incrementally.
+            self._decoder = codecs.getincrementaldecoder(self.encoding)()
+            self._current = []
 
     def on_data(self, data: bytes):
+        self._current_size += len(data)
+        if (self.max_part_size is not None and
+                self._current_size > self.max_part_size):
+            self._abort("Multipart part is too large.")
         if b"Content-Type" in self._current_headers:
             self._current.write(data)
             self._current.size += len(data)
         else:
-            self._current += data.decode()
+            self._current.append(self._decoder.decode(data))
 
     def on_part_complete(self):
         name = self._current_params.get(b"name", b"").decode()
         if b"Content-Type" in self._current_headers:
             self._current.seek(0)
             if not self._current.filename:
-                if not self._current.getbuffer().nbytes:
+                if not self._current.size:
                     # This is an empty file with no name
                     # We do *not* save it.
+                    self._current.close()
                     self._current = None
                     return
                 # at this point, we've got content but no name.
@@ -67,6 +165,8 @@ class Multipart:
                 self._current.filename = str(id(self._current))
             self.form.append((name, self._current))
         else:
-            if self._current:
-                self.form.append((name, self._current))
+            self._current.append(self._decoder.decode(b"", final=True))
+            value = "".join(self._current)
+            if value:
+                self.form.append((name, value))
         self._current = None
@@ -1,8 +1,11 @@
+from copy import deepcopy
+from types import MappingProxyType
 from typing import TypeVar
 from collections.abc import (
     Mapping, Iterable, Iterator, Callable, MutableMapping, Sequence)
-from kettu.headers import Cookies, ContentType, ETag, Links
-from kettu.headers.utils import serialize_http_datetime
+from kettu.headers import Cookies, ContentType, ETag, Links, RenderedCookie
+from kettu.headers.utils import (
+    serialize_http_datetime, canonical_header_name)
 
 
 BodyT = str | bytes | Iterator[bytes]
@@ -12,6 +15,21 @@ F = TypeVar("F", bound=Callable)
 
 UNSET = object()
 
+# Encoded header names, as (canonical, lowercased) bytes.
+ENCODED_NAMES_MAX = 1024
+_encoded_names: dict[str, tuple[bytes, bytes]] = {}
+
+
+def encode_header_name(name: str) -> tuple[bytes, bytes]:
+    try:
+        return _encoded_names[name]
+    except KeyError:
+        encoded = name.encode("latin-1")
+        encoded = (encoded, encoded.lower())
+        if len(_encoded_names) < ENCODED_NAMES_MAX:
+            _encoded_names[name] = encoded
+        return encoded
+
 
 def header_property(
         name: str,
@@ -20,7 +38,7 @@ def header_property(
         documentation="",
 ):
 
-    name = name.title()
+    name = canonical_header_name(name)
 
     def getter(self):
         try:
@@ -42,17 +60,27 @@ def header_property(
     return property(getter, setter, remover, documentation)
 
 
+class HeaderLines(list[str]):
+    """Values of a header emitted as separate lines, never comma-joined.
+    """
+
+
 class ResponseHeaders(MutableMapping[str, str]):
-    __slots__ = ("_cookies", "_links", "_headers")
+    __slots__ = ("_cookies", "_links", "_headers", "_template")
 
     _cookies: Cookies | None
     _links: Links | None
-    _headers: MutableMapping
+    _headers: MutableMapping[str, str | list[str]]
+    _template: "FrozenResponseHeaders | None"
 
     last_modified = header_property(
         'Last-Modified', caster=serialize_http_datetime
     )
 
+    date = header_property(
+        'Date', caster=serialize_http_datetime
+    )
+
     accept_ranges = header_property(
         'Accept-Ranges'
     )
@@ -78,12 +106,16 @@ class ResponseHeaders(MutableMapping[str, str]):
             data: (MutableMapping[str, str] |
                    Sequence[tuple[str, str]] | None) = None
     ):
-        if data is not None and isinstance(data, cls):
-            return data
+        if data is not None:
+            if isinstance(data, FrozenResponseHeaders):
+                return data.derive(cls)
+            if isinstance(data, cls):
+                return data
         inst = super().__new__(cls)
         inst._cookies = None
         inst._links = None
         inst._headers = {}
+        inst._template = None
         if data:
             if isinstance(data, dict):
                 for key, value in data.items():
@@ -97,19 +129,66 @@ class ResponseHeaders(MutableMapping[str, str]):
     def cookies(self) -> Cookies:
         if self._cookies is None:
             self._cookies = Cookies()
+        elif (self._template is not None and
+              self._cookies is self._template._cookies):
+            self._cookies = Cookies(self._cookies)
         return self._cookies
 
     @property
     def links(self) -> Links:
         if self._links is None:
             self._links = Links()
+        elif (self._template is not None and
+              self._links is self._template._links):
+            # Links are mutable : the template keeps its own.
+            self._links = deepcopy(self._links)
         return self._links
 
+    def _own_headers(self):
+        """Copy the headers shared with the template, before a write."""
+        if (self._template is not None and
+                self._headers is self._template._headers):
+            self._headers = {
+                name: type(value)(value) if isinstance(value, list)
+                else value
+                for name, value in self._headers.items()
+            }
+
+    def freeze(self) -> "FrozenResponseHeaders":
+        """Immutable copy, to be used as a template : headers derived
+        from it share its values until they are modified.
+        """
+        inst = object.__new__(FrozenResponseHeaders)
+        inst._template = None
+        inst._headers = {
+            name: type(value)(value) if isinstance(value, list) else value
+            for name, value in self._headers.items()
+        }
+        # Cookies are rendered, as they can't be modified in place.
+        inst._cookies = Cookies({
+            name: cookie if isinstance(cookie, RenderedCookie)
+            else RenderedCookie(name, str(cookie))
+            for name, cookie in self._cookies.items()
+        }) if self._cookies else None
+        inst._links = deepcopy(self._links) if self._links else None
+        return inst
+
     def __repr__(self):
         return f"<{self.__class__.__name__}: [{len(self)}]>"
 
     def __getitem__(self, name: str):
-        return self._headers[name.title()]
+        value = self._headers[canonical_header_name(name)]
+        if isinstance(value, list):
+            return ", ".join(value)
+        return value
+
+    def getlist(self, name: str) -> list[str]:
+        value = self._headers.get(canonical_header_name(name))
+        if value is None:
+            return []
+        if isinstance(value, list):
+            return list(value)
+        return [value]
 
     def __len__(self):
         length = len(self._headers)
@@ -120,7 +199,7 @@ class ResponseHeaders(MutableMapping[str, str]):
         return length
 
     def __contains__(self, name: str):
-        name = name.title()
+        name = canonical_header_name(name)
         if name == "Link":
             return bool(self._links)
         if name == "Set-Cookie":
@@ -135,25 +214,48 @@ class ResponseHeaders(MutableMapping[str, str]):
         )
 
     def __setitem__(self, name: str, value: str):
-        name = name.title()
+        name = canonical_header_name(name)
         if name in ('Set-Cookie', 'Link'):
             raise KeyError()
+        self._own_headers()
         self._headers[name] = value
 
     def __delitem__(self, name: str):
-        name = name.title()
+        name = canonical_header_name(name)
         if name == "Set-Cookie":
             self._cookies = None
         elif name == "Link":
             self._links = None
         else:
+            self._own_headers()
             del self._headers[name]
 
     def add(self, name: str, value: str, merge: bool = True):
-        if name in self and merge:
-            self[name] += ", " + value
-        else:
+        """Add a value to a header. Values are kept in a list and only
+        comma-joined when serialized. Without `merge`, the header
+        value is replaced.
+        """
+        name = canonical_header_name(name)
+        self._own_headers()
+        current = self._headers.get(name) if merge else None
+        if current is None:
             self[name] = value
+        elif isinstance(current, list):
+            current.append(value)
+        else:
+            self._headers[name] = [current, value]
+
+    def append(self, name: str, value: str):
+        """Add a value to a header that must not be comma-merged :
+        each value is emitted on its own header line.
+        """
+        name = canonical_header_name(name)
+        self._own_headers()
+        current = self._headers.get(name)
+        if isinstance(current, HeaderLines):
+            current.append(value)
+        else:
+            self[name] = HeaderLines((*self.getlist(name), value))
 
     def __iter__(self):
         yield from self._headers.keys()
@@ -163,8 +265,70 @@ class ResponseHeaders(MutableMapping[str, str]):
             yield "Link"
 
     def items(self):
-        yield from self._headers.items()
+        for name, value in self._headers.items():
+            if isinstance(value, HeaderLines):
+                for line in value:
+                    yield name, line
+            elif isinstance(value, list):
+                yield name, ", ".join(value)
+            else:
+                yield name, value
         if self._cookies:
-            yield "Set-Cookie", self._cookies.as_header()
+            for cookie in self._cookies.as_headers():
+                yield "Set-Cookie", cookie
         if self._links:
             yield "Link", self._links.as_header()
+
+    def as_asgi(self) -> list[tuple[bytes, bytes]]:
+        """Headers as ASGI expects them : lowercased bytes names."""
+        return [
+            (encode_header_name(name)[1], value.encode("latin-1"))
+            for name, value in self.items()
+        ]
+
+    def as_bytes(self) -> bytes:
+        """HTTP/1.1 header block, each line terminated by CRLF."""
+        return b"".join([
+            encode_header_name(name)[0] + b": " +
+            value.encode("latin-1") + b"\r\n"
+            for name, value in self.items()
+        ])
+
+
+class FrozenResponseHeaders(ResponseHeaders):
+    """Immutable response headers, built once and shared.
+
+    `ResponseHeaders(template)` derives mutable headers from it :
+    values are not copied nor cast again until they are modified.
+    """
+    __slots__ = ()
+
+    def __new__(
+            cls,
+            data: (MutableMapping[str, str] |
+                   Sequence[tuple[str, str]] | None) = None
+    ):
+        if data is not None and isinstance(data, cls):
+            return data
+        return ResponseHeaders(data).freeze()
+
+    def derive(self, cls: type[ResponseHeaders] = ResponseHeaders):
+        inst = object.__new__(cls)
+        inst._template = self
+        inst._headers = self._headers
+        inst._cookies = self._cookies
+        inst._links = self._links
+        return inst
+
+    @property
+    def cookies(self) -> Mapping:
+        return MappingProxyType(self._cookies or {})
+
+    @property
+    def links(self) -> tuple:
+        return tuple(deepcopy(self._links or ()))
+
+    def _frozen(self, *args, **kwargs):
+        raise TypeError(f"{self.__class__.__name__} is immutable.")
+
+    __setitem__ = __delitem__ = add = append = _frozen
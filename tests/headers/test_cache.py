@@ -0,0 +1,71 @@
+import pytest
+import threading
+from kettu.headers import Accept, ContentType, Languages, ParsingCache
+
+
+def test_parsing_cache():
+    cache = ParsingCache(Accept.from_string, maxsize=2)
+    assert len(cache) == 0
+
+    accept = cache("text/html, application/json;q=0.5")
+    assert accept == ("text/html", "application/json")
+    assert cache.hits == 0
+    assert cache.misses == 1
+
+    assert cache("text/html, application/json;q=0.5") is accept
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert len(cache) == 1
+
+
+def test_parsing_cache_eviction():
+    cache = ParsingCache(ContentType.from_string, maxsize=2)
+    html = cache("text/html")
+    cache("application/json")
+    cache("text/html")  # refreshed, "application/json" is now the oldest.
+    cache("text/plain")
+    assert len(cache) == 2
+    assert cache.misses == 3
+    assert cache("text/html") is html
+    cache("text/plain")
+    assert cache.misses == 3
+    cache("application/json")
+    assert cache.misses == 4
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == cache.misses == 0
+
+
+def test_parsing_cache_errors():
+    cache = ParsingCache(Languages.from_string)
+    with pytest.raises(ValueError):
+        cache("ru;q=0.0")
+    assert len(cache) == 0
+    assert cache.misses == 1
+
+    with pytest.raises(ValueError):
+        ParsingCache(Languages.from_string, maxsize=0)
+
+
+def test_parsing_cache_threads():
+    cache = ParsingCache(ContentType.from_string, maxsize=4)
+    values = [f"text/x-{i}" for i in range(16)]
+    errors = []
+
+    def work():
+        try:
+            for _ in range(200):
+                for value in values:
+                    cache(value)
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert len(cache) == 4
+    assert cache.hits + cache.misses == 8 * 200 * 16
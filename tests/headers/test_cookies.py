@@ -1,5 +1,7 @@
+import pytest
 from biscuits import Cookie
-from kettu.headers import Cookies
+from kettu.exceptions import HTTPError
+from kettu.headers import Cookies, RenderedCookie, RequestCookies
 
 
 def test_request_parse_cookies():
@@ -11,3 +13,60 @@ def test_request_parse_cookies():
     # No cookie
     cookies = Cookies.from_string("")
     assert not cookies
+
+
+def test_cookies_as_headers():
+    cookies = Cookies()
+    cookies.add(Cookie('key', 'value'))
+    cookies.add(RenderedCookie.create('flag', 'on'))
+    assert list(cookies.as_headers()) == [
+        'key=value; Path=/',
+        'flag=on; Path=/',
+    ]
+
+
+def test_request_cookies_lazy():
+    header = (
+        'a=1; b="x y"; c=caf%C3%A9; d="q\\"w"; e; f=; a=2; g = h ;'
+    )
+    cookies = RequestCookies(header)
+    assert len(cookies) == 6
+    assert list(cookies) == ['a', 'b', 'c', 'd', 'f', 'g']
+    assert cookies._decoded == {}
+
+    assert cookies['c'] == 'café'
+    assert cookies._decoded == {'c': 'café'}
+    assert cookies['a'] == '2'
+    assert cookies['b'] == 'x y'
+    assert cookies['d'] == 'q"w'
+    assert cookies['f'] == ''
+    assert cookies['g'] == 'h'
+    assert cookies.get('e') is None
+    assert 'e' not in cookies
+
+    # Same results as the eager parsing.
+    assert dict(RequestCookies('a=1; b="x y"; a=2')) == dict(
+        Cookies.from_string('a=1; b="x y"; a=2'))
+
+    assert not RequestCookies("")
+
+
+def test_request_cookies_limits():
+    header = "; ".join(f"c{i}=value" for i in range(10))
+    cookies = RequestCookies(header, max_size=len(header), max_count=10)
+    assert len(cookies) == 10
+
+    with pytest.raises(HTTPError) as exc:
+        RequestCookies(header, max_size=len(header) - 1)
+    assert exc.value.status == 431
+
+    with pytest.raises(HTTPError) as exc:
+        RequestCookies.from_string(header, max_count=9)
+    assert exc.value.status == 431
+
+    # Duplicated names count for each occurrence.
+    header = "; ".join("a=1" for _ in range(100))
+    assert RequestCookies(header, max_count=100)["a"] == "1"
+    with pytest.raises(HTTPError) as exc:
+        RequestCookies(header, max_count=99)
+    assert exc.value.status == 431
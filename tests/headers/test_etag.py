@@ -1,4 +1,6 @@
-from kettu.headers import ETag, ETags
+import pytest
+from kettu.headers import ETag, ETags, StreamingETag
+from kettu.response import ResponseHeaders
 
 
 def test_etag():
@@ -40,3 +42,86 @@ def test_if_match():
         "ebeb4dbc1362d124452335a71286c21d",
         "sdfe7vvc5sf68aaerv85"
     }
+
+
+def test_etag_from_body():
+    etag = ETag.from_body(b"some content")
+    assert etag.weak is False
+    assert len(etag.value) == 32
+    assert ETag.from_body(iter((b"some ", b"con", b"tent"))) == etag
+    assert ETag.from_body(b"other content") != etag
+
+
+def test_streaming_etag():
+    chunks = (b"some ", b"con", b"tent")
+    stream = StreamingETag(iter(chunks))
+    with pytest.raises(ValueError):
+        stream.etag
+
+    assert b"".join(stream) == b"some content"
+    assert stream.etag == ETag.from_body(b"some content")
+
+    headers = ResponseHeaders()
+    headers.etag = stream.etag
+    assert headers.etag == f'"{stream.etag.value}"'
+
+
+def test_etag_from_stat(tmp_path):
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"some content")
+    stat = path.stat()
+    etag = ETag.from_stat(stat)
+    assert etag.weak is True
+    assert etag.value == (
+        f"{stat.st_ino:x}-{stat.st_mtime_ns:x}-{stat.st_size:x}")
+    assert etag.as_header().startswith('W/"')
+
+
+def test_etags_quoted_commas():
+    im = ETags.from_string('"a,b", W/"c, d" ,"e"')
+    assert im == {
+        ETag("a,b"),
+        ETag("c, d", weak=True),
+        ETag("e")
+    }
+    assert ETags.from_string(' * ').wildcard
+    assert ETags.from_string('*').as_header() == '*'
+    assert ETags.from_string('unquoted') == {ETag("unquoted")}
+
+    with pytest.raises(ValueError):
+        ETags.from_string(' , ')
+
+
+def test_etags_max_tags():
+    header = ",".join(f'"{i}"' for i in range(10))
+    assert len(ETags.from_string(header, max_tags=10)) == 10
+    with pytest.raises(ValueError):
+        ETags.from_string(header, max_tags=9)
+
+    class BoundedETags(ETags):
+        max_tags = 5
+
+    with pytest.raises(ValueError):
+        BoundedETags.from_string(header)
+
+
+def test_etags_quoted_wildcard():
+    etags = ETags.from_string('"*"')
+    assert not etags.wildcard
+    assert etags == {ETag("*")}
+    assert etags.as_header() == '"*"'
+
+    with pytest.raises(ValueError):
+        ETags.from_string('*, "a"')
+
+
+def test_etags_malformed():
+    for header in ('W/ "x"', '"abc" junk', '"unterminated', '"a""b"',
+                   '"a" "b"', 'W/"a" x"'):
+        with pytest.raises(ValueError):
+            ETags.from_string(header)
+
+    # Empty list elements and optional whitespace are fine.
+    assert ETags.from_string(' , "a" ,, W/"b" , ') == {
+        ETag("a"), ETag("b", weak=True)
+    }
@@ -11,3 +11,15 @@ def test_encode_uri():
     assert utils.encode_uri(uri) == (
         "http://test.fr/url%21/%C3%A9l%C3%A9phant?search=gris%20%26%20africain"
     )
+
+
+def test_canonical_header_name():
+    assert utils.canonical_header_name("etag") == "ETag"
+    assert utils.canonical_header_name("Etag") == "ETag"
+    assert utils.canonical_header_name("www-authenticate") == (
+        "WWW-Authenticate")
+    assert utils.canonical_header_name("CONTENT-MD5") == "Content-MD5"
+    assert utils.canonical_header_name("content-type") == "Content-Type"
+    assert utils.canonical_header_name("x-custom-thing") == "X-Custom-Thing"
+    assert utils.canonical_header_name("x-custom-thing") is (
+        utils.canonical_header_name("X-CUSTOM-THING"))
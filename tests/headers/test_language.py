@@ -1,4 +1,4 @@
-from kettu.headers import Languages, Language
+from kettu.headers import Languages, Language, SupportedLanguages
 from kettu.headers.constants import Specificity
 
 def test_language():
@@ -65,3 +65,28 @@ def test_language_negotiation():
 
     langs = Languages.from_string('fi-FI')
     assert langs.negotiate(('fr-FR', 'en')) is None
+
+
+def test_language_negotiation_supported_languages():
+    supported = SupportedLanguages(
+        ('fr-FR', 'en', 'de-DE', 'zh-Hant-TW', 'zh-Hans-CN'))
+    assert len(supported) == 5
+
+    langs = Languages.from_string(
+        'en-EN;q=0.5, fr-FR;q=0.8, de; q=0.3, ru; q=0.0'
+    )
+    assert langs.negotiate(supported) == 'fr-FR'
+    assert Languages.from_string('ru, de').negotiate(supported) == 'de-DE'
+    assert Languages.from_string('en-US').negotiate(supported) == 'en'
+    assert Languages.from_string('zh-Hans-CN').negotiate(supported) == (
+        'zh-Hans-CN')
+    assert Languages.from_string('zh').negotiate(supported) == 'zh-Hant-TW'
+    assert Languages.from_string('fi-FI').negotiate(supported) is None
+    assert Languages.from_string('*').negotiate(supported) == 'fr-FR'
+
+    # Results are the same as the linear negotiation.
+    for header in ('en-EN;q=0.5, fr-FR;q=0.8', 'zh-Hans-CN, *;q=0.1',
+                   'de-AT', 'fr-CA;q=0.4, en-GB;q=0.9', 'zh-Hant-HK'):
+        langs = Languages.from_string(header)
+        assert langs.negotiate(supported) == langs.negotiate(
+            supported.candidates)
@@ -1,4 +1,4 @@
-from kettu.headers import Accept
+from kettu.headers import Accept, SupportedMediaTypes
 
 
 def test_accept():
@@ -21,3 +21,30 @@ def test_accept():
     )
     assert accept.negotiate(('text/plain',)) == 'text/plain'
     assert accept.negotiate(('image/jpg',)) is None
+
+
+def test_accept_negotiate_supported_media_types():
+    supported = SupportedMediaTypes(
+        ('application/json', 'text/html', 'text/plain'))
+    assert len(supported) == 3
+
+    accept = Accept.from_string(
+        "application/json;q=0.8, text/html;q=0.7, text/*;q=0.5")
+    assert accept.negotiate(supported) == 'application/json'
+
+    accept = Accept.from_string("text/*, image/png")
+    assert accept.negotiate(supported) == 'text/html'
+
+    accept = Accept.from_string("image/*;q=0.9, */*;q=0.1")
+    assert accept.negotiate(supported) == 'application/json'
+
+    accept = Accept.from_string("image/png")
+    assert accept.negotiate(supported) is None
+    assert accept.negotiate(SupportedMediaTypes(())) is None
+
+    # Results are the same as the linear negotiation.
+    for header in ("text/plain, text/*", "text/*;q=0.2, */*;q=0.5",
+                   "application/*", "image/*, */*;q=0.1"):
+        accept = Accept.from_string(header)
+        assert accept.negotiate(supported) == accept.negotiate(
+            supported.candidates)
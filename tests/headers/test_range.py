@@ -1,4 +1,8 @@
-from kettu.headers import Ranges
+import os
+import pytest
+from kettu.exceptions import HTTPError
+from kettu.headers import Ranges, RangeFile, RangePolicy, MultipartRanges
+from kettu.headers.ranges import bytes_multipart, consolidate_ranges
 
 
 def test_range():
@@ -51,3 +55,141 @@ def test_ranges_resolve():
     rg = Ranges.from_string("bytes=-1,20-100,0-1,101-120")
     resolved = rg.resolve(150, merge=True)
     assert resolved.values == ((0, 1), (20, 120), (149, 149))
+
+
+def test_ranges_resolve_unsatisfiable():
+    rg = Ranges.from_string("bytes=0-9,200-300")
+    assert rg.resolve(150).values == ((0, 9),)
+
+    rg = Ranges.from_string("bytes=200-300")
+    with pytest.raises(HTTPError) as exc:
+        rg.resolve(150)
+    assert exc.value.status == 416
+
+
+def test_bytes_multipart():
+    body = bytes(range(10))
+    rg = Ranges.from_string("bytes=0-1,-2")
+    gen = bytes_multipart(body, "application/octet-stream", rg, 10)
+    next(gen)
+    chunks = [gen.send("BOUNDARY")] + list(gen)
+    assert chunks == [
+        "--BOUNDARY\r\n",
+        "Content-Type: application/octet-stream\r\n",
+        "Content-Range: bytes 0-1/10\r\n\r\n",
+        b"\x00\x01",
+        "\r\n",
+        "--BOUNDARY\r\n",
+        "Content-Type: application/octet-stream\r\n",
+        "Content-Range: bytes 8-9/10\r\n\r\n",
+        b"\x08\x09",
+        "\r\n",
+        "--BOUNDARY--\r\n",
+    ]
+
+
+def test_range_file(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(bytes(range(100)))
+
+    rg = Ranges.from_string("bytes=10-19,-5")
+    with RangeFile(path) as rf:
+        assert rf.size == 100
+        views = list(rf.slices(rg))
+        assert [type(v) for v in views] == [memoryview, memoryview]
+        assert bytes(views[0]) == bytes(range(10, 20))
+        assert bytes(views[1]) == bytes(range(95, 100))
+        del views
+
+        spans = list(rf.slices(rg, sendfile=True))
+        assert spans == [(rf.fd, 10, 10), (rf.fd, 95, 5)]
+
+        body = b"".join(
+            bytes(chunk) for chunk in rf.multipart(rg, "video/mp4", "XX"))
+        assert body == (
+            b"--XX\r\nContent-Type: video/mp4\r\n"
+            b"Content-Range: bytes 10-19/100\r\n\r\n" +
+            bytes(range(10, 20)) +
+            b"\r\n--XX\r\nContent-Type: video/mp4\r\n"
+            b"Content-Range: bytes 95-99/100\r\n\r\n" +
+            bytes(range(95, 100)) +
+            b"\r\n--XX--\r\n"
+        )
+
+        with pytest.raises(HTTPError) as exc:
+            list(rf.slices(Ranges.from_string("knots=0-1")))
+        assert exc.value.status == 416
+
+    assert rf.fd == -1
+
+
+def test_range_file_descriptor(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(bytes(range(100)))
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        with RangeFile(fd) as rf:
+            chunks = list(rf.multipart(
+                Ranges.from_string("bytes=0-3"), "text/plain", "XX",
+                sendfile=True))
+            assert chunks[1] == (fd, 0, 4)
+        # The descriptor is not ours to close.
+        assert os.fstat(fd)
+    finally:
+        os.close(fd)
+
+
+def test_ranges_multipart_content_length():
+    body = bytes(range(100))
+    rg = Ranges.from_string("bytes=10-19,-5,0-0")
+    multipart = rg.multipart(100, "text/plain", "XX")
+    assert isinstance(multipart, MultipartRanges)
+    assert multipart.media_type == "multipart/byteranges; boundary=XX"
+    assert multipart.parts[0] == (
+        b"--XX\r\nContent-Type: text/plain\r\n"
+        b"Content-Range: bytes 10-19/100\r\n\r\n", 10, 19
+    )
+
+    chunks = list(multipart.chunks(body))
+    assert all(isinstance(c, (bytes, memoryview)) for c in chunks)
+    payload = b"".join(chunks)
+    assert len(payload) == multipart.content_length
+    assert payload.endswith(b"\x00\r\n--XX--\r\n")
+
+    merged = rg.multipart(100, "text/plain", "XX", merge=True)
+    assert [(f, l) for _, f, l in merged.parts] == [
+        (0, 0), (10, 19), (95, 99)]
+    assert len(b"".join(merged.chunks(body))) == merged.content_length
+
+
+def test_ranges_policy():
+    rg = Ranges.from_string("bytes=0-9,20-29,40-49")
+    assert rg.resolve(100, policy=RangePolicy()) == rg
+
+    policy = RangePolicy(max_ranges=2)
+    assert rg.resolve(100, policy=policy) is None
+    assert rg.multipart(100, "text/plain", "XX", policy=policy) is None
+    with pytest.raises(HTTPError) as exc:
+        rg.resolve(100, policy=policy._replace(fallback=416))
+    assert exc.value.status == 416
+
+    policy = RangePolicy(coalesce_gap=10)
+    assert rg.resolve(100, policy=policy).values == ((0, 49),)
+    policy = RangePolicy(coalesce_gap=9)
+    assert rg.resolve(100, policy=policy).values == rg.values
+
+    # Overlapping ranges amplify the served bytes.
+    rg = Ranges.from_string("bytes=" + ",".join(["0-59"] * 3))
+    policy = RangePolicy(max_ratio=1.0)
+    assert rg.resolve(100, policy=policy) is None
+    assert rg.resolve(100, merge=True, policy=policy).values == ((0, 59),)
+
+
+def test_consolidate_ranges():
+    assert list(consolidate_ranges([])) == []
+    assert list(consolidate_ranges([(0, 4), (5, 9), (20, 29)])) == [
+        (0, 9), (20, 29)]
+    assert list(consolidate_ranges([(20, 29), (5, 9), (0, 4)])) == [
+        (0, 9), (20, 29)]
+    assert list(consolidate_ranges([(20, 29), (0, 4)], gap=15)) == [
+        (0, 29)]
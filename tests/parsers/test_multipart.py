@@ -0,0 +1,179 @@
+import asyncio
+import pytest
+from tempfile import SpooledTemporaryFile
+from kettu.exceptions import HTTPError
+from kettu.parsers.multipart import Multipart
+
+
+CONTENT_TYPE = "multipart/form-data; boundary=foo"
+
+BODY = (
+    b'--foo\r\n'
+    b'Content-Disposition: form-data; name="name"\r\n\r\n'
+    b'h\xc3\xa9ll\xc3\xb8\r\n'
+    b'--foo\r\n'
+    b'Content-Disposition: form-data; name="file"; filename="x.txt"\r\n'
+    b'Content-Type: text/plain\r\n\r\n'
+    b'some file content\r\n'
+    b'--foo--\r\n'
+)
+
+
+def feed(parser, body, chunk_size=1):
+    for i in range(0, len(body), chunk_size):
+        parser.feed_data(body[i:i + chunk_size])
+    return parser.form
+
+
+def test_multipart_split_multibyte_characters():
+    form = feed(Multipart(CONTENT_TYPE), BODY)
+    assert len(form) == 2
+    assert form[0] == ("name", "héllø")
+    name, file = form[1]
+    assert name == "file"
+    assert file.filename == "x.txt"
+    assert file.size == 17
+    assert file.read() == b"some file content"
+
+
+def test_multipart_spooling():
+    form = feed(Multipart(CONTENT_TYPE, spool_max_size=4), BODY, 7)
+    name, file = form[1]
+    assert isinstance(file, SpooledTemporaryFile)
+    assert file._rolled
+    assert file.filename == "x.txt"
+    assert file.read() == b"some file content"
+
+    form = feed(Multipart(CONTENT_TYPE, spool_max_size=1024), BODY, 7)
+    name, file = form[1]
+    assert not file._rolled
+    assert file.read() == b"some file content"
+
+
+def test_multipart_limits():
+    with pytest.raises(HTTPError) as exc:
+        feed(Multipart(CONTENT_TYPE, max_body_size=100), BODY, 10)
+    assert exc.value.status == 413
+
+    with pytest.raises(HTTPError) as exc:
+        feed(Multipart(CONTENT_TYPE, max_part_size=10), BODY, 10)
+    assert exc.value.status == 413
+
+    parser = Multipart(CONTENT_TYPE, max_parts=1)
+    with pytest.raises(HTTPError) as exc:
+        feed(parser, BODY, 10)
+    assert exc.value.status == 413
+    assert parser.form == [("name", "héllø")]
+
+    form = feed(Multipart(
+        CONTENT_TYPE,
+        max_body_size=len(BODY),
+        max_part_size=17,
+        max_parts=2
+    ), BODY)
+    assert len(form) == 2
+
+
+def test_multipart_feed_stream_async_iterable():
+
+    async def chunks():
+        for i in range(0, len(BODY), 10):
+            yield BODY[i:i + 10]
+
+    async def consume():
+        parser = Multipart(CONTENT_TYPE)
+        return [part async for part in parser.feed_stream(chunks())]
+
+    form = asyncio.run(consume())
+    assert len(form) == 2
+    assert form[0] == ("name", "héllø")
+    assert form[1][1].read() == b"some file content"
+
+
+def test_multipart_feed_stream_asgi_receive():
+    cut = BODY.index(b"Content-Disposition", 10)
+    messages = [
+        {"type": "http.request", "body": BODY[:cut], "more_body": True},
+        {"type": "http.request", "body": BODY[cut:], "more_body": False},
+    ]
+    received = []
+
+    async def receive():
+        message = messages.pop(0)
+        received.append(message)
+        return message
+
+    async def consume():
+        parser = Multipart(CONTENT_TYPE)
+        stream = parser.feed_stream(receive)
+        first = await anext(stream)
+        # The first part is available before the rest is read.
+        assert len(received) == 1
+        return [first] + [part async for part in stream]
+
+    form = asyncio.run(consume())
+    assert [name for name, _ in form] == ["name", "file"]
+
+
+def test_multipart_feed_stream_disconnect():
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def consume():
+        parser = Multipart(CONTENT_TYPE)
+        return [part async for part in parser.feed_stream(receive)]
+
+    with pytest.raises(HTTPError) as exc:
+        asyncio.run(consume())
+    assert exc.value.status == 400
+
+
+def test_multipart_abort_closes_files():
+    parser = Multipart(
+        CONTENT_TYPE, spool_max_size=4, max_body_size=len(BODY) - 1)
+    with pytest.raises(HTTPError) as exc:
+        feed(parser, BODY)
+    assert exc.value.status == 413
+    assert [(name, value.closed) for name, value in parser.form
+            if not isinstance(value, str)] == [("file", True)]
+
+
+def test_multipart_feed_stream_abort_keeps_emitted_files():
+    body = (
+        b'--foo\r\n'
+        b'Content-Disposition: form-data; name="a"; filename="a.txt"\r\n'
+        b'Content-Type: text/plain\r\n\r\n'
+        b'first\r\n'
+        b'--foo\r\n'
+        b'Content-Disposition: form-data; name="b"; filename="b.txt"\r\n'
+        b'Content-Type: text/plain\r\n\r\n'
+        b'second\r\n'
+        b'--foo\r\n'
+        b'Content-Disposition: form-data; name="c"; filename="c.txt"\r\n'
+        b'Content-Type: text/plain\r\n\r\n'
+        b'third part, too large\r\n'
+        b'--foo--\r\n'
+    )
+    cut = body.index(b'second')
+
+    async def chunks():
+        yield body[:cut]
+        yield body[cut:]
+
+    parser = Multipart(CONTENT_TYPE, max_part_size=8)
+
+    async def consume():
+        stream = parser.feed_stream(chunks())
+        name, file = await anext(stream)
+        assert name == "a"
+        # "b" is parsed, but "c" is too large before "b" is handed over.
+        with pytest.raises(HTTPError) as exc:
+            await anext(stream)
+        assert exc.value.status == 413
+        return file
+
+    file = asyncio.run(consume())
+    assert file.read() == b"first"
+    assert [(name, value.closed) for name, value in parser.form] == [
+        ("a", False), ("b", True)]
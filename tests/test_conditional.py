@@ -0,0 +1,124 @@
+import pytest
+from datetime import datetime
+from kettu.exceptions import HTTPError
+from kettu.conditional import Conditions, Precondition, evaluate_preconditions
+from kettu.headers import ETag, ETags
+
+
+ETAG = ETag("abc")
+LAST_MODIFIED = 1445412480  # Wed, 21 Oct 2015 07:28:00 GMT
+BEFORE = "Tue, 20 Oct 2015 07:28:00 GMT"
+AT = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+
+def evaluate(headers, method="GET", etag=ETAG, last_modified=LAST_MODIFIED):
+    return evaluate_preconditions(
+        headers, method, etag=etag, last_modified=last_modified)
+
+
+def test_no_preconditions():
+    assert evaluate({}) == Precondition.FULL
+    assert evaluate({'Range': 'bytes=0-1'}) == Precondition.RANGE
+    assert evaluate({'Range': 'bytes=0-1'}, "HEAD") == Precondition.FULL
+
+
+def test_if_match():
+    assert evaluate({'If-Match': '"abc"'}) == Precondition.FULL
+    assert evaluate({'If-Match': '"x", "abc"'}) == Precondition.FULL
+    assert evaluate({'If-Match': '*'}, etag=None) == Precondition.FULL
+    assert evaluate({'If-Match': '"xyz"'}) == Precondition.FAILED
+    # Strong comparison.
+    assert evaluate({'If-Match': 'W/"abc"'}) == Precondition.FAILED
+    assert evaluate(
+        {'If-Match': '"abc"'}, etag=ETag("abc", weak=True)
+    ) == Precondition.FAILED
+    # If-Match takes precedence over If-Unmodified-Since.
+    assert evaluate(
+        {'If-Match': '"abc"', 'If-Unmodified-Since': BEFORE}
+    ) == Precondition.FULL
+
+
+def test_if_unmodified_since():
+    assert evaluate({'If-Unmodified-Since': AT}) == Precondition.FULL
+    assert evaluate(
+        {'if-unmodified-since': BEFORE}, "PUT") == Precondition.FAILED
+    assert evaluate(
+        {'If-Unmodified-Since': 'garbage'}) == Precondition.FULL
+
+
+def test_if_none_match():
+    assert evaluate({'If-None-Match': '"abc"'}) == Precondition.NOT_MODIFIED
+    # Weak comparison.
+    assert evaluate(
+        {'If-None-Match': 'W/"abc"'}, "HEAD") == Precondition.NOT_MODIFIED
+    assert evaluate({'If-None-Match': '*'}) == Precondition.NOT_MODIFIED
+    assert evaluate({'If-None-Match': '"abc"'}, "PUT") == (
+        Precondition.FAILED)
+    assert evaluate({'If-None-Match': '"xyz"'}) == Precondition.FULL
+    # If-None-Match takes precedence over If-Modified-Since.
+    assert evaluate(
+        {'If-None-Match': '"xyz"', 'If-Modified-Since': AT}
+    ) == Precondition.FULL
+
+
+def test_if_modified_since():
+    assert evaluate({'If-Modified-Since': AT}) == Precondition.NOT_MODIFIED
+    assert evaluate(
+        {'If-Modified-Since': AT},
+        last_modified=datetime(2015, 10, 21, 7, 28)
+    ) == Precondition.NOT_MODIFIED
+    assert evaluate({'If-Modified-Since': BEFORE}) == Precondition.FULL
+    assert evaluate({'If-Modified-Since': AT}, "POST") == Precondition.FULL
+
+
+def test_if_range():
+    headers = {'Range': 'bytes=0-1', 'If-Range': '"abc"'}
+    assert evaluate(headers) == Precondition.RANGE
+    assert evaluate(
+        headers, etag=ETag("abc", weak=True)) == Precondition.FULL
+    assert evaluate(headers, etag=ETag("xyz")) == Precondition.FULL
+
+    headers = {'Range': 'bytes=0-1', 'If-Range': AT}
+    assert evaluate(headers) == Precondition.RANGE
+    assert evaluate(headers, last_modified=LAST_MODIFIED + 1) == (
+        Precondition.FULL)
+
+
+def test_conditions_reuse():
+    conditions = Conditions.from_headers({'If-None-Match': '"a", "b"'})
+    assert conditions.evaluate(etag=ETag("b")) == Precondition.NOT_MODIFIED
+    assert conditions.evaluate(etag=ETag("c")) == Precondition.FULL
+    assert Precondition.NOT_MODIFIED == 304
+
+
+def test_malformed_entity_tags(monkeypatch):
+    with pytest.raises(HTTPError) as exc:
+        evaluate({'If-None-Match': ','})
+    assert exc.value.status == 400
+
+    monkeypatch.setattr(ETags, 'max_tags', 2)
+    with pytest.raises(HTTPError) as exc:
+        evaluate({'If-Match': '"a", "b", "c"'})
+    assert exc.value.status == 400
+    assert evaluate({'If-Match': '"a", "abc"'}) == Precondition.FULL
+
+
+def test_quoted_wildcard():
+    # `"*"` is an opaque entity-tag, not the wildcard.
+    assert evaluate({'If-None-Match': '"*"'}) == Precondition.FULL
+    assert evaluate({'If-None-Match': '"*"'}, etag=ETag("*")) == (
+        Precondition.NOT_MODIFIED)
+    assert evaluate({'If-Match': '"*"'}) == Precondition.FAILED
+    assert evaluate({'If-Match': '"*"'}, etag=None) == Precondition.FAILED
+
+
+def test_overflowing_date_is_ignored():
+    assert evaluate(
+        {'If-Modified-Since': '1 Jan 10000000000 00:00:00'}
+    ) == Precondition.FULL
+
+
+def test_malformed_weak_entity_tag():
+    with pytest.raises(HTTPError) as exc:
+        evaluate({'If-Match': 'W/ "abc"'}, "PUT")
+    assert exc.value.status == 400
@@ -0,0 +1,148 @@
+import pytest
+from dataclasses import FrozenInstanceError
+from kettu.cors import CORSPolicy, Origins, normalize_header_names
+
+
+def test_origins_allow_list():
+    origins = Origins((
+        "https://app.example.com",
+        "https://*.tenants.example.com",
+        "http://*.local:8080",
+    ))
+    assert "https://app.example.com" in origins
+    assert "https://a.tenants.example.com" in origins
+    assert "https://a.b.tenants.example.com" in origins
+    assert "https://tenants.example.com" not in origins
+    assert "http://a.tenants.example.com" not in origins
+    assert "http://dev.local:8080" in origins
+    assert "http://dev.local" not in origins
+    assert "https://evil.com" not in origins
+
+
+def test_cors_policy_headers():
+    policy = CORSPolicy(
+        methods=("GET", "POST"),
+        allow_headers=("X-Token",),
+        max_age=600,
+        credentials=True
+    )
+    assert policy.headers() == (
+        ("Access-Control-Allow-Origin", "*"),
+        ("Access-Control-Allow-Methods", "GET, POST"),
+        ("Access-Control-Allow-Headers", "X-Token"),
+        ("Access-Control-Max-Age", "600"),
+        ("Access-Control-Allow-Credentials", "true"),
+    )
+    assert policy.headers() is policy.headers()
+    with pytest.raises(FrozenInstanceError):
+        policy.origin = "https://example.com"
+
+
+def test_cors_policy_allow_list():
+    policy = CORSPolicy(
+        origin=("https://example.com", "https://*.example.com"),
+        expose_headers=("X-Total",)
+    )
+    assert policy.headers("https://api.example.com") == (
+        ("Access-Control-Allow-Origin", "https://api.example.com"),
+        ("Vary", "Origin"),
+        ("Access-Control-Expose-Headers", "X-Total"),
+    )
+    assert policy.headers("https://evil.com") == (
+        ("Vary", "Origin"),
+        ("Access-Control-Expose-Headers", "X-Total"),
+    )
+
+
+def test_cors_preflight():
+    policy = CORSPolicy(origin="https://example.com", methods=("GET",))
+    assert policy.preflight(
+        "https://example.com", "GET", "X-Token") == (
+        ("Vary", "Origin, Access-Control-Request-Headers"),
+        ("Access-Control-Allow-Origin", "https://example.com"),
+        ("Access-Control-Allow-Methods", "GET"),
+        ("Access-Control-Allow-Headers", "x-token"),
+    )
+    assert policy.preflight("https://other.com", "GET") == (
+        ("Vary", "Origin, Access-Control-Request-Headers"),
+        ("Access-Control-Allow-Origin", "https://example.com"),
+        ("Access-Control-Allow-Methods", "GET"),
+    )
+
+    policy = CORSPolicy(allow_headers=("X-Token",), max_age=60)
+    assert policy.preflight("https://example.com", "PUT") == (
+        ("Vary", "Access-Control-Request-Method"),
+        ("Access-Control-Allow-Origin", "*"),
+        ("Access-Control-Allow-Methods", "PUT"),
+        ("Access-Control-Allow-Headers", "X-Token"),
+        ("Access-Control-Max-Age", "60"),
+    )
+
+    policy = CORSPolicy(origin=["https://*.example.com"])
+    assert policy.preflight("https://evil.com", "PUT") == (
+        ("Vary", ("Origin, Access-Control-Request-Method, "
+                  "Access-Control-Request-Headers")),
+        ("Access-Control-Allow-Methods", "PUT"),
+    )
+
+
+def test_normalize_header_names():
+    assert normalize_header_names("X-Token, content-type,x-token") == (
+        "content-type, x-token"
+    )
+    assert normalize_header_names(" , ") == ""
+
+
+def test_cors_preflight_cache():
+    policy = CORSPolicy(
+        origin=("https://*.example.com",),
+        methods=("GET", "PUT"),
+        preflight_cache_size=2
+    )
+    headers = policy.preflight(
+        "https://a.example.com", "PUT", "X-Token, Content-Type")
+    assert headers == (
+        ("Vary", "Origin, Access-Control-Request-Headers"),
+        ("Access-Control-Allow-Origin", "https://a.example.com"),
+        ("Access-Control-Allow-Methods", "GET, PUT"),
+        ("Access-Control-Allow-Headers", "content-type, x-token"),
+    )
+    assert policy.preflight(
+        "https://a.example.com", "GET", "content-type,X-TOKEN") is headers
+    assert policy._preflight_cache.hits == 1
+    assert policy._preflight_cache.misses == 1
+
+    policy = CORSPolicy(preflight_cache_size=2)
+    headers = policy.preflight("https://a.com", "GET")
+    assert policy.preflight("https://b.com", "GET") is headers
+    assert policy.preflight(None, "GET") == (
+        ("Vary", ("Access-Control-Request-Method, "
+                  "Access-Control-Request-Headers")),
+        ("Access-Control-Allow-Methods", "GET"),
+    )
+
+
+def test_cors_preflight_cache_key():
+    policy = CORSPolicy(
+        origin=("https://example.com",), preflight_cache_size=2)
+    allowed = policy.preflight("https://example.com", "GET")
+    denied = policy.preflight("https://evil0.com", "GET")
+    for n in range(1, 5):
+        assert policy.preflight(f"https://evil{n}.com", "GET") is denied
+    assert policy.preflight("https://example.com", "GET") is allowed
+    assert policy._preflight_cache.misses == 2
+
+    policy = CORSPolicy(origin="https://example.com", preflight_cache_size=2)
+    headers = policy.preflight("https://a.com", "GET")
+    assert policy.preflight("https://b.com", "GET") is headers
+
+
+def test_cors_preflight_cache_same_output():
+    cached = CORSPolicy(preflight_cache_size=2)
+    uncached = CORSPolicy()
+    for args in (
+            ("https://a.com", "PUT", "X-Token, Content-Type"),
+            ("https://a.com", None, None),
+            (None, "GET", "x-token"),
+    ):
+        assert cached.preflight(*args) == uncached.preflight(*args)
@@ -1,6 +1,8 @@
+import pytest
 from datetime import datetime, timezone, timedelta
+from kettu.headers import utils
 from kettu.headers.utils import (
-    parse_http_datetime, serialize_http_datetime
+    parse_http_datetime, parse_http_timestamp, serialize_http_datetime
 )
 
 
@@ -20,3 +22,56 @@ def test_dumps_datetime_as_http():
     tz = timezone(timedelta(hours=2), name="CET")
     dt = datetime(2015, 10, 21, 7, 28, tzinfo=tz)
     assert serialize_http_datetime(dt) == "Wed, 21 Oct 2015 05:28:00 GMT"
+
+
+def test_dumps_timestamp_as_http():
+    assert serialize_http_datetime(1445412480) == (
+        "Wed, 21 Oct 2015 07:28:00 GMT"
+    )
+    assert serialize_http_datetime(1445412480.75) == (
+        "Wed, 21 Oct 2015 07:28:00 GMT"
+    )
+    # Cached for the same second.
+    assert serialize_http_datetime(
+        datetime(2015, 10, 21, 7, 28, 0, 500)) is serialize_http_datetime(
+            1445412480)
+    assert serialize_http_datetime(0) == "Thu, 01 Jan 1970 00:00:00 GMT"
+
+
+def test_dumps_datetime_is_locale_independent():
+    import locale
+    try:
+        locale.setlocale(locale.LC_TIME, "fr_FR.UTF-8")
+    except locale.Error:
+        pytest.skip("French locale is not available.")
+    try:
+        assert serialize_http_datetime(1445412480) == (
+            "Wed, 21 Oct 2015 07:28:00 GMT"
+        )
+    finally:
+        locale.setlocale(locale.LC_TIME, "C")
+
+
+def test_parse_http_timestamp():
+    assert parse_http_timestamp("Wed, 21 Oct 2015 07:28:00 GMT") == (
+        1445412480)
+    assert parse_http_timestamp("Wednesday, 21-Oct-15 07:28:00 GMT") == (
+        1445412480)
+    assert parse_http_timestamp("Wed Oct 21 07:28:00 2015") == 1445412480
+    assert parse_http_timestamp("Sun Nov  6 08:49:37 1994") == 784111777
+    # Lenient fallback.
+    assert parse_http_timestamp("Wed, 21 Oct 2015 09:28:00 +0200") == (
+        1445412480)
+
+    hits = utils.http_timestamps.hits
+    parse_http_timestamp("Wed, 21 Oct 2015 07:28:00 GMT")
+    assert utils.http_timestamps.hits == hits + 1
+
+    with pytest.raises(ValueError):
+        parse_http_timestamp("Wed, 21 Foo 2015 07:28:00 GMT")
+    with pytest.raises(ValueError):
+        parse_http_timestamp("Wed, 21 Oct 2015 25:28:00 GMT")
+    with pytest.raises(ValueError):
+        parse_http_timestamp("yesterday")
+    with pytest.raises(ValueError):
+        parse_http_timestamp("1 Jan 10000000000 00:00:00")
@@ -0,0 +1,53 @@
+import sys
+import json
+import subprocess
+
+
+HEAVY_MODULES = ("langcodes", "biscuits", "multifruits", "urllib.request")
+
+LIGHT_IMPORT = "from kettu.headers import parse_host, Query, Authorization"
+EAGER_IMPORT = "from kettu.headers import *"
+
+# Light imports took about half the time of eager ones. The ratio,
+# rather than a duration, absorbs the speed of the machine.
+IMPORT_RATIO_BUDGET = 0.8
+
+
+def measure(statement: str) -> dict:
+    code = (
+        "import sys, json, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps({'elapsed': elapsed, "
+        f"'loaded': [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output)
+
+
+def best_time(statement: str, runs: int = 3) -> float:
+    return min(measure(statement)["elapsed"] for _ in range(runs))
+
+
+def test_light_imports_skip_heavy_dependencies():
+    assert measure(LIGHT_IMPORT)["loaded"] == []
+
+
+def test_light_imports_time_budget():
+    light = best_time(LIGHT_IMPORT)
+    eager = best_time(EAGER_IMPORT)
+    assert light < eager * IMPORT_RATIO_BUDGET
+
+
+def test_heavy_dependencies_load_on_first_use():
+    result = measure("from kettu.headers import Languages")
+    assert result["loaded"] == ["langcodes"]
+
+    result = measure(
+        "from kettu.headers import Cookies\n"
+        "Cookies.from_string('key=value')")
+    assert result["loaded"] == ["biscuits"]
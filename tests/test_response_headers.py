@@ -1,8 +1,8 @@
 import pytest
 import hamcrest
 from datetime import datetime
-from kettu.response import ResponseHeaders, UNSET
-from kettu.headers import ETag
+from kettu.response import ResponseHeaders, FrozenResponseHeaders, UNSET
+from kettu.headers import ETag, Link, RenderedCookie
 
 
 def test_link_container():
@@ -52,7 +52,7 @@ def test_etag_property():
     headers.etag = "whatever"
     assert headers.etag == '"whatever"'
     assert headers == {
-        'Etag': '"whatever"'
+        'ETag': '"whatever"'
     }
     del headers.etag
     assert headers == {}
@@ -60,7 +60,7 @@ def test_etag_property():
     headers.etag = "whatever"
     headers.etag = "however"
     assert headers == {
-        'Etag': '"however"'
+        'ETag': '"however"'
     }
 
     headers.etag = ETag("some value", weak=True)
@@ -211,3 +211,177 @@ def test_headers_coalescence_with_cookies_no_direct_assignation():
 
     with pytest.raises(KeyError):
         headers.add('Set-Cookie', 'other=foobar')
+
+
+def test_headers_as_bytes():
+    headers = ResponseHeaders({'Content-Type': 'text/html', 'X-Token': 'é'})
+    headers.cookies.set('test', 'value')
+
+    assert headers.as_asgi() == [
+        (b'content-type', b'text/html'),
+        (b'x-token', b'\xe9'),
+        (b'set-cookie', b'test=value; Path=/'),
+    ]
+    assert headers.as_bytes() == (
+        b'Content-Type: text/html\r\n'
+        b'X-Token: \xe9\r\n'
+        b'Set-Cookie: test=value; Path=/\r\n'
+    )
+    assert ResponseHeaders().as_bytes() == b''
+
+
+def test_headers_canonical_names():
+    headers = ResponseHeaders()
+    headers['www-authenticate'] = 'Basic'
+    headers['content-md5'] = 'Q2hlY2sgSW50ZWdyaXR5IQ=='
+    assert 'WWW-Authenticate' in headers
+    assert headers['Www-Authenticate'] == 'Basic'
+    assert list(headers) == ['WWW-Authenticate', 'Content-MD5']
+    del headers['CONTENT-MD5']
+    assert list(headers) == ['WWW-Authenticate']
+
+
+def test_headers_multiple_values():
+    headers = ResponseHeaders()
+    headers.add('Vary', 'Origin')
+    headers.add('vary', 'Accept')
+    headers.add('Vary', 'Accept-Encoding')
+    assert headers['Vary'] == 'Origin, Accept, Accept-Encoding'
+    assert headers.getlist('Vary') == ['Origin', 'Accept', 'Accept-Encoding']
+    assert headers.getlist('Cache-Control') == []
+    assert list(headers.items()) == [
+        ('Vary', 'Origin, Accept, Accept-Encoding')
+    ]
+
+    headers.add('Vary', 'Cookie', merge=False)
+    assert headers.getlist('Vary') == ['Cookie']
+
+
+def test_headers_separate_lines():
+    headers = ResponseHeaders()
+    headers.add('X-Trace', 'first')
+    headers.append('X-Trace', 'second')
+    headers.append('X-Trace', 'third, with comma')
+    assert len(headers) == 1
+    assert headers.getlist('X-Trace') == [
+        'first', 'second', 'third, with comma']
+    assert list(headers.items()) == [
+        ('X-Trace', 'first'),
+        ('X-Trace', 'second'),
+        ('X-Trace', 'third, with comma'),
+    ]
+    assert headers.as_bytes() == (
+        b'X-Trace: first\r\n'
+        b'X-Trace: second\r\n'
+        b'X-Trace: third, with comma\r\n'
+    )
+
+    with pytest.raises(KeyError):
+        headers.append('Set-Cookie', 'other=foobar')
+
+
+def test_frozen_headers_template():
+    template = FrozenResponseHeaders([
+        ('X-Frame-Options', 'DENY'),
+        ('Vary', 'Origin'),
+    ])
+    assert FrozenResponseHeaders(template) is template
+
+    with pytest.raises(TypeError):
+        template['X-Frame-Options'] = 'SAMEORIGIN'
+    with pytest.raises(TypeError):
+        template.add('Vary', 'Accept')
+    with pytest.raises(TypeError):
+        del template['Vary']
+    with pytest.raises(TypeError):
+        template.content_type = 'text/html'
+
+    headers = ResponseHeaders(template)
+    assert type(headers) is ResponseHeaders
+    assert headers._headers is template._headers
+    assert headers['X-Frame-Options'] == 'DENY'
+
+    headers.add('Vary', 'Accept')
+    headers.content_type = 'text/html'
+    assert headers._headers is not template._headers
+    assert headers.getlist('Vary') == ['Origin', 'Accept']
+    assert template.getlist('Vary') == ['Origin']
+    assert 'Content-Type' not in template
+
+    other = ResponseHeaders(template)
+    del other['Vary']
+    assert list(other) == ['X-Frame-Options']
+    assert list(template) == ['X-Frame-Options', 'Vary']
+
+
+def test_frozen_headers_cookies():
+    headers = ResponseHeaders()
+    headers.cookies.set('consent', 'yes')
+    template = headers.freeze()
+    headers.cookies.set('other', 'no')
+    assert list(template.cookies) == ['consent']
+
+    derived = ResponseHeaders(template)
+    assert list(derived.items()) == [('Set-Cookie', 'consent=yes; Path=/')]
+    derived.cookies.set('session', 'abc')
+    assert list(template.cookies) == ['consent']
+    assert list(derived.cookies) == ['consent', 'session']
+
+
+def test_frozen_headers_mutable_values():
+    headers = ResponseHeaders()
+    headers.cookies.set('consent', 'yes')
+    headers.links.append(Link('/style.css', rel='preload'))
+    template = headers.freeze()
+    headers.cookies['consent'].value = 'no'
+    headers.links[0].rel = 'prefetch'
+
+    derived = ResponseHeaders(template)
+    assert isinstance(derived.cookies['consent'], RenderedCookie)
+    with pytest.raises(AttributeError):
+        derived.cookies['consent'].value = 'no'
+    derived.cookies.set('consent', 'no')
+    derived.links[0].rel = 'prefetch'
+    assert list(derived.items()) == [
+        ('Set-Cookie', 'consent=no; Path=/'),
+        ('Link', '</style.css>; rel=prefetch'),
+    ]
+
+    with pytest.raises(AttributeError):
+        template.cookies['consent'].value = 'no'
+    template.links[0].rel = 'prefetch'
+    expected = [
+        ('Set-Cookie', 'consent=yes; Path=/'),
+        ('Link', '</style.css>; rel=preload'),
+    ]
+    assert list(template.items()) == expected
+    assert list(ResponseHeaders(template).items()) == expected
+
+
+def test_date_property():
+    headers = ResponseHeaders()
+    assert headers.date is UNSET
+    headers.date = 1712254020
+    assert headers.date == "Thu, 04 Apr 2024 18:07:00 GMT"
+    headers.last_modified = 1712254020
+    assert headers.last_modified == "Thu, 04 Apr 2024 18:07:00 GMT"
+
+
+def test_response_cookies_separate_lines():
+    consent = RenderedCookie.create(
+        'consent', 'yes', expires=datetime(2030, 1, 1), max_age=3600)
+    assert consent.name == 'consent'
+    assert 'Expires=Tue, 01 Jan 2030 00:00:00 GMT' in consent.header
+
+    headers = ResponseHeaders()
+    headers.cookies.add(consent)
+    headers.cookies.set('session', 'abc')
+    assert len(headers) == 1
+    assert list(headers.items()) == [
+        ('Set-Cookie', consent.header),
+        ('Set-Cookie', 'session=abc; Path=/'),
+    ]
+    assert headers.as_bytes() == (
+        b'Set-Cookie: ' + consent.header.encode() + b'\r\n'
+        b'Set-Cookie: session=abc; Path=/\r\n'
+    )